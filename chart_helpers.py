@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Raw-dict Plotly helpers
+Builds figures as plain {"data": [...], "layout": {...}} dicts so chart scripts
+skip graph_objects validation, and writes them to standalone HTML.
+"""
+
+import numpy as np
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    from plotly.io.json import to_json_plotly
+
+# MinMaxLTTB is the aggregator plotly-resampler uses; optional like the resampler itself
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:
+    MinMaxLTTBDownsampler = None
+
+# Longest line series shipped to the browser before downsampling kicks in
+MAX_LINE_POINTS = 2000
+
+# plotly.js build matching the installed plotly.py, which produced the figure JSON
+PLOTLYJS_CDN_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+# Standalone page loading plotly.js from the CDN, filled with
+# (plotly.js URL, div height, data JSON, layout JSON)
+HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <script charset="utf-8" src="%s"></script>
+    <div id="chart" style="height:%s; width:100%%;"></div>
+    <script type="text/javascript">
+        Plotly.newPlot("chart", %s, %s, {"responsive": true});
+    </script>
+</body>
+</html>
+"""
+
+
+def downsample(x, y, n_out: int = MAX_LINE_POINTS):
+    """Thin a long line series to n_out points with MinMaxLTTB; short series pass through"""
+    y = np.asarray(y, dtype=np.float64)
+    if MinMaxLTTBDownsampler is None or len(y) <= n_out:
+        return x, y
+    x = np.asarray(x)
+    # Pass the real positions so irregular date spacing is respected; dates go in as int64
+    x_pos = x if x.dtype.kind in "iuf" else x.astype("datetime64[ns]").view(np.int64)
+    idx = MinMaxLTTBDownsampler().downsample(x_pos, y, n_out=n_out)
+    return x[idx], y[idx]
+
+
+def axis_refs(row: int, col: int, cols: int = 1):
+    """Return the (xref, yref) pair for a subplot cell, numbered like make_subplots"""
+    idx = (row - 1) * cols + col
+    suffix = "" if idx == 1 else str(idx)
+    return f"x{suffix}", f"y{suffix}"
+
+
+def subplot_layout(rows: int = 1, cols: int = 1, row_heights=None, shared_xaxes: bool = False,
+                   vertical_spacing: float = None, horizontal_spacing: float = None,
+                   subplot_titles=()) -> dict:
+    """Raw layout equivalent of make_subplots: axis domains plus subplot title annotations"""
+    if vertical_spacing is None:
+        vertical_spacing = 0.3 / rows
+    if horizontal_spacing is None:
+        horizontal_spacing = 0.2 / cols
+    row_heights = row_heights or [1] * rows
+
+    col_width = (1 - horizontal_spacing * (cols - 1)) / cols
+    height_scale = (1 - vertical_spacing * (rows - 1)) / sum(row_heights)
+
+    # Rows are laid out top to bottom, so walk the y domains down from 1.0
+    y_domains = []
+    top = 1.0
+    for h in row_heights:
+        bottom = top - h * height_scale
+        y_domains.append([max(bottom, 0.0), top])
+        top = bottom - vertical_spacing
+
+    layout = {"annotations": []}
+    titles = list(subplot_titles)
+    for r in range(1, rows + 1):
+        for c in range(1, cols + 1):
+            xref, yref = axis_refs(r, c, cols)
+            left = (c - 1) * (col_width + horizontal_spacing)
+            x_domain = [left, left + col_width]
+            y_domain = y_domains[r - 1]
+
+            xaxis = {"anchor": yref, "domain": x_domain}
+            if shared_xaxes and r < rows:
+                xaxis["matches"] = axis_refs(rows, c, cols)[0]
+                xaxis["showticklabels"] = False
+            layout["xaxis" + xref[1:]] = xaxis
+            layout["yaxis" + yref[1:]] = {"anchor": xref, "domain": y_domain}
+
+            idx = (r - 1) * cols + c - 1
+            if idx < len(titles) and titles[idx]:
+                layout["annotations"].append({
+                    "text": titles[idx],
+                    "x": (x_domain[0] + x_domain[1]) / 2,
+                    "y": y_domain[1],
+                    "xref": "paper",
+                    "yref": "paper",
+                    "xanchor": "center",
+                    "yanchor": "bottom",
+                    "showarrow": False,
+                    "font": {"size": 16}
+                })
+
+    return layout
+
+
+def json_default(obj):
+    """Serialize the pandas/numpy values orjson does not handle natively"""
+    if hasattr(obj, "to_numpy"):
+        # Series/Index -> ndarray, which OPT_SERIALIZE_NUMPY then encodes
+        return obj.to_numpy()
+    if hasattr(obj, "tolist"):
+        # String/object arrays and numpy scalars
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json(obj) -> str:
+    """Encode figure data or layout as JSON that is safe inside a <script> tag"""
+    if orjson is not None:
+        text = orjson.dumps(obj, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    else:
+        text = to_json_plotly(obj)
+    return text.replace("</", "<\\/")
+
+
+def write_html(fig: dict, output_path):
+    """Write a raw-dict figure into the standalone HTML template"""
+    layout = fig.get("layout", {})
+    template = layout.get("template")
+    if isinstance(template, str):
+        # plotly.js has no named templates; expand the name the way go.Figure would
+        layout = {**layout, "template": pio.templates[template].to_plotly_json()}
+
+    height = f"{layout['height']}px" if "height" in layout else "100%"
+    html = HTML_TEMPLATE % (PLOTLYJS_CDN_URL, height, to_json(fig.get("data", [])), to_json(layout))
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
@@ -5,50 +5,74 @@ Creates interactive Plotly charts comparing predictions between platforms
 """
 
 import json
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from chart_helpers import downsample, subplot_layout, write_html
+
 # Load data
 DATA_DIR = Path(__file__).parent / ".cache"
 
+BASE_DARK = {
+    "template": "plotly_dark",
+    "height": 700,
+    "showlegend": True,
+    "legend": {
+        "yanchor": "top",
+        "y": 0.99,
+        "xanchor": "right",
+        "x": 0.99,
+        "bgcolor": "rgba(0,0,0,0.5)"
+    },
+    "hovermode": "x unified"
+}
+
+
+def read_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
 
 def load_data():
     """Load Kalshi and Polymarket data"""
-    with open(DATA_DIR / "kalshi_data.json") as f:
-        kalshi = json.load(f)
-    
-    with open(DATA_DIR / "daily_price_volume.json") as f:
-        polymarket = json.load(f)
+    kalshi = read_json(DATA_DIR / "kalshi_data.json")
+    polymarket = read_json(DATA_DIR / "daily_price_volume.json")
     
     return kalshi, polymarket
 
 
 def get_matching_dates(kalshi_data: list, polymarket_data: list):
     """Find matching dates between Kalshi and Polymarket data"""
-    kalshi_dates = {d["date"]: d for d in kalshi_data}
-    polymarket_dates = {d["date"]: d for d in polymarket_data}
+    kalshi_is_shorter = len(kalshi_data) <= len(polymarket_data)
+    short, long = (kalshi_data, polymarket_data) if kalshi_is_shorter else (polymarket_data, kalshi_data)
+    
+    # Index the longer list once and probe it with the shorter one, so only
+    # overlapping entries of the shorter list are ever put in a dict
+    long_dates = {d["date"]: d for d in long}
+    short_dates = {d["date"]: d for d in short if d["date"] in long_dates}
     
     # Find overlapping dates
-    common_dates = sorted(set(kalshi_dates.keys()) & set(polymarket_dates.keys()))
+    common_dates = sorted(short_dates)
     
-    return common_dates, kalshi_dates, polymarket_dates
+    if kalshi_is_shorter:
+        return common_dates, short_dates, long_dates
+    return common_dates, long_dates, short_dates
 
 
-def create_presidential_comparison(kalshi, polymarket):
+def create_presidential_comparison(common_dates, kalshi_dict, polymarket_dict):
     """Create comparison chart for 2024 Presidential election"""
-    kalshi_data = kalshi.get("presidential", {}).get("daily_data", [])
-    polymarket_data = polymarket.get("presidential_2024_trump", {}).get("daily_data", [])
-    
-    if not kalshi_data:
-        print("No Kalshi presidential data available")
-        return None
-    
-    common_dates, kalshi_dict, polymarket_dict = get_matching_dates(kalshi_data, polymarket_data)
-    
-    # Create figure with secondary y-axis
-    fig = make_subplots(
+    # Two stacked panels sharing the date axis
+    layout = subplot_layout(
         rows=2, cols=1,
         row_heights=[0.7, 0.3],
         shared_xaxes=True,
@@ -59,54 +83,66 @@ def create_presidential_comparison(kalshi, polymarket):
         )
     )
     
-    # Extract data for common dates
+    # Extract prices for common dates in one pass into preallocated arrays
     dates = common_dates
-    kalshi_prices = [kalshi_dict[d]["price"] * 100 for d in dates]
-    polymarket_prices = [polymarket_dict[d]["price"] * 100 for d in dates]
-    price_diff = [k - p for k, p in zip(kalshi_prices, polymarket_prices)]
+    n = len(dates)
+    kalshi_prices = np.empty(n)
+    polymarket_prices = np.empty(n)
+    for i, d in enumerate(dates):
+        kalshi_prices[i] = kalshi_dict[d]["price"]
+        polymarket_prices[i] = polymarket_dict[d]["price"]
+    kalshi_prices *= 100
+    polymarket_prices *= 100
+    price_diff = kalshi_prices - polymarket_prices
     
     # Green/red styling for price difference
-    diff_colors = ["#00C853" if d > 0 else "#FF1744" for d in price_diff]
-    
-    # Price comparison lines
-    fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=kalshi_prices,
-            mode="lines+markers",
-            name="Kalshi",
-            line=dict(color="#7C4DFF", width=3),
-            marker=dict(size=6),
-            hovertemplate="Kalshi: %{y:.1f}%<extra></extra>"
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=polymarket_prices,
-            mode="lines+markers",
-            name="Polymarket",
-            line=dict(color="#00BCD4", width=3),
-            marker=dict(size=6),
-            hovertemplate="Polymarket: %{y:.1f}%<extra></extra>"
-        ),
-        row=1, col=1
-    )
+    diff_colors = np.where(price_diff > 0, "#00C853", "#FF1744").tolist()
+    
+    kalshi_x, kalshi_y = downsample(dates, kalshi_prices)
+    polymarket_x, polymarket_y = downsample(dates, polymarket_prices)
+    
+    data = [
+        # Price comparison lines (WebGL, one canvas regardless of point count)
+        {
+            "type": "scattergl",
+            "x": kalshi_x,
+            "y": kalshi_y,
+            "mode": "lines+markers",
+            "name": "Kalshi",
+            "line": {"color": "#7C4DFF", "width": 3},
+            "marker": {"size": 6},
+            "hovertemplate": "Kalshi: %{y:.1f}%<extra></extra>",
+            "xaxis": "x",
+            "yaxis": "y"
+        },
+        {
+            "type": "scattergl",
+            "x": polymarket_x,
+            "y": polymarket_y,
+            "mode": "lines+markers",
+            "name": "Polymarket",
+            "line": {"color": "#00BCD4", "width": 3},
+            "marker": {"size": 6},
+            "hovertemplate": "Polymarket: %{y:.1f}%<extra></extra>",
+            "xaxis": "x",
+            "yaxis": "y"
+        },
+        # Price difference bar
+        {
+            "type": "bar",
+            "x": dates,
+            "y": price_diff,
+            "name": "Difference",
+            "marker": {"color": diff_colors},
+            "hovertemplate": "Diff: %{y:+.1f}%<extra></extra>",
+            "showlegend": False,
+            "xaxis": "x2",
+            "yaxis": "y2"
+        }
+    ]
     
-    # Price difference bar
-    fig.add_trace(
-        go.Bar(
-            x=dates,
-            y=price_diff,
-            name="Difference",
-            marker_color=diff_colors,
-            hovertemplate="Diff: %{y:+.1f}%<extra></extra>",
-            showlegend=False
-        ),
-        row=2, col=1
-    )
+    shapes = []
+    annotations = layout["annotations"]
     
     # Add key events
     events = [
@@ -115,27 +151,32 @@ def create_presidential_comparison(kalshi, polymarket):
         ("2024-11-05", "Election Day"),
     ]
     
+    # Label height and date lookup are computed once for all events
+    y_top = float(max(kalshi_prices.max(), polymarket_prices.max())) + 2
+    dates_set = set(dates)
+    
     for date, label in events:
-        if date in dates:
-            fig.add_vline(
-                x=date,
-                line_dash="dash",
-                line_color="rgba(255,255,255,0.3)",
-                row=1, col=1
-            )
-            fig.add_annotation(
-                x=date,
-                y=max(kalshi_prices + polymarket_prices) + 2,
-                text=label,
-                showarrow=False,
-                font=dict(size=10, color="white"),
-                row=1, col=1
-            )
+        if date in dates_set:
+            shapes.append({
+                "type": "line",
+                "x0": date, "x1": date, "xref": "x",
+                "y0": 0, "y1": 1, "yref": "y domain",
+                "line": {"dash": "dash", "color": "rgba(255,255,255,0.3)"}
+            })
+            annotations.append({
+                "x": date,
+                "y": y_top,
+                "xref": "x",
+                "yref": "y",
+                "text": label,
+                "showarrow": False,
+                "font": {"size": 10, "color": "white"}
+            })
     
     # Calculate statistics
-    avg_diff = sum(price_diff) / len(price_diff)
-    max_diff = max(price_diff)
-    min_diff = min(price_diff)
+    avg_diff = price_diff.mean()
+    max_diff = price_diff.max()
+    min_diff = price_diff.min()
     
     # Add stats box
     stats_text = f"<b>Statistics ({len(dates)} days)</b><br>"
@@ -143,243 +184,192 @@ def create_presidential_comparison(kalshi, polymarket):
     stats_text += f"Max Kalshi Lead: {max_diff:+.1f}%<br>"
     stats_text += f"Max Poly Lead: {min_diff:+.1f}%"
     
-    fig.add_annotation(
-        x=0.02,
-        y=0.98,
-        xref="paper",
-        yref="paper",
-        text=stats_text,
-        showarrow=False,
-        font=dict(size=11, color="white"),
-        align="left",
-        bgcolor="rgba(0,0,0,0.5)",
-        bordercolor="rgba(255,255,255,0.3)",
-        borderwidth=1,
-        borderpad=8
-    )
-    
-    # Update layout
-    fig.update_layout(
-        title=dict(
-            text="<b>🇺🇸 2024 Presidential Election: Trump Win Probability</b><br><sup>Kalshi vs Polymarket Platform Comparison</sup>",
-            font=dict(size=20)
-        ),
-        template="plotly_dark",
-        height=700,
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor="rgba(0,0,0,0.5)"
-        ),
-        hovermode="x unified"
-    )
-    
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Win Probability (%)", row=1, col=1)
-    fig.update_yaxes(title_text="Diff (%)", row=2, col=1)
+    annotations.append({
+        "x": 0.02,
+        "y": 0.98,
+        "xref": "paper",
+        "yref": "paper",
+        "text": stats_text,
+        "showarrow": False,
+        "font": {"size": 11, "color": "white"},
+        "align": "left",
+        "bgcolor": "rgba(0,0,0,0.5)",
+        "bordercolor": "rgba(255,255,255,0.3)",
+        "borderwidth": 1,
+        "borderpad": 8
+    })
     
     # Add zero line for difference chart
-    fig.add_hline(y=0, line_dash="dot", line_color="rgba(255,255,255,0.5)", row=2, col=1)
+    shapes.append({
+        "type": "line",
+        "x0": 0, "x1": 1, "xref": "x2 domain",
+        "y0": 0, "y1": 0, "yref": "y2",
+        "line": {"dash": "dot", "color": "rgba(255,255,255,0.5)"}
+    })
+    
+    layout["xaxis2"]["title"] = {"text": "Date"}
+    layout["yaxis"]["title"] = {"text": "Win Probability (%)"}
+    layout["yaxis2"]["title"] = {"text": "Diff (%)"}
+    layout.update(
+        BASE_DARK,
+        title={
+            "text": "<b>🇺🇸 2024 Presidential Election: Trump Win Probability</b><br><sup>Kalshi vs Polymarket Platform Comparison</sup>",
+            "font": {"size": 20}
+        },
+        shapes=shapes
+    )
     
-    return fig
+    return {"data": data, "layout": layout}
 
 
-def create_scatter_comparison(kalshi, polymarket):
+def create_scatter_comparison(common_dates, kalshi_dict, polymarket_dict):
     """Create scatter plot comparing Kalshi vs Polymarket prices"""
-    kalshi_data = kalshi.get("presidential", {}).get("daily_data", [])
-    polymarket_data = polymarket.get("presidential_2024_trump", {}).get("daily_data", [])
-    
-    if not kalshi_data:
-        print("No Kalshi presidential data available")
-        return None
-    
-    common_dates, kalshi_dict, polymarket_dict = get_matching_dates(kalshi_data, polymarket_data)
-    
     # Extract prices
-    kalshi_prices = [kalshi_dict[d]["price"] * 100 for d in common_dates]
-    polymarket_prices = [polymarket_dict[d]["price"] * 100 for d in common_dates]
+    kalshi_prices, polymarket_prices = [], []
+    for d in common_dates:
+        kalshi_prices.append(kalshi_dict[d]["price"] * 100)
+        polymarket_prices.append(polymarket_dict[d]["price"] * 100)
+    kalshi_prices = np.asarray(kalshi_prices, dtype=np.float64)
+    polymarket_prices = np.asarray(polymarket_prices, dtype=np.float64)
     
     # Color by date (earlier = lighter)
     colors = list(range(len(common_dates)))
     
-    fig = go.Figure()
-    
-    # Add scatter points
-    fig.add_trace(
-        go.Scatter(
-            x=polymarket_prices,
-            y=kalshi_prices,
-            mode="markers+text",
-            marker=dict(
-                size=12,
-                color=colors,
-                colorscale="Viridis",
-                showscale=True,
-                colorbar=dict(
-                    title="Day",
-                    tickvals=[0, len(common_dates)//2, len(common_dates)-1],
-                    ticktext=[common_dates[0], common_dates[len(common_dates)//2], common_dates[-1]]
-                )
-            ),
-            text=[d.split("-")[1] + "/" + d.split("-")[2] for d in common_dates],
-            textposition="top center",
-            textfont=dict(size=8, color="rgba(255,255,255,0.6)"),
-            hovertemplate="<b>%{customdata}</b><br>Polymarket: %{x:.1f}%<br>Kalshi: %{y:.1f}%<extra></extra>",
-            customdata=common_dates
-        )
-    )
-    
-    # Add diagonal parity line
-    min_val = min(min(kalshi_prices), min(polymarket_prices)) - 2
-    max_val = max(max(kalshi_prices), max(polymarket_prices)) + 2
-    
-    fig.add_trace(
-        go.Scatter(
-            x=[min_val, max_val],
-            y=[min_val, max_val],
-            mode="lines",
-            line=dict(dash="dash", color="rgba(255,255,255,0.5)", width=2),
-            name="Parity Line",
-            showlegend=True
-        )
-    )
+    # Diagonal parity line bounds
+    min_val = float(min(kalshi_prices.min(), polymarket_prices.min())) - 2
+    max_val = float(max(kalshi_prices.max(), polymarket_prices.max())) + 2
+    
+    data = [
+        # Scatter points; dates are shown on hover rather than as per-point labels
+        {
+            "type": "scattergl",
+            "x": polymarket_prices,
+            "y": kalshi_prices,
+            "mode": "markers",
+            "marker": {
+                "size": 12,
+                "color": colors,
+                "colorscale": "Viridis",
+                "showscale": True,
+                "colorbar": {
+                    "title": {"text": "Day"},
+                    "tickvals": [0, len(common_dates)//2, len(common_dates)-1],
+                    "ticktext": [common_dates[0], common_dates[len(common_dates)//2], common_dates[-1]]
+                }
+            },
+            "hovertemplate": "<b>%{customdata}</b><br>Polymarket: %{x:.1f}%<br>Kalshi: %{y:.1f}%<extra></extra>",
+            "customdata": common_dates
+        },
+        # Diagonal parity line
+        {
+            "type": "scatter",
+            "x": [min_val, max_val],
+            "y": [min_val, max_val],
+            "mode": "lines",
+            "line": {"dash": "dash", "color": "rgba(255,255,255,0.5)", "width": 2},
+            "name": "Parity Line",
+            "showlegend": True
+        }
+    ]
     
     # Calculate correlation
-    n = len(kalshi_prices)
-    mean_k = sum(kalshi_prices) / n
-    mean_p = sum(polymarket_prices) / n
-    
-    cov = sum((k - mean_k) * (p - mean_p) for k, p in zip(kalshi_prices, polymarket_prices)) / n
-    std_k = (sum((k - mean_k)**2 for k in kalshi_prices) / n) ** 0.5
-    std_p = (sum((p - mean_p)**2 for p in polymarket_prices) / n) ** 0.5
-    correlation = cov / (std_k * std_p)
-    
-    # Add annotation
-    fig.add_annotation(
-        x=0.05,
-        y=0.95,
-        xref="paper",
-        yref="paper",
-        text=f"<b>Correlation: r = {correlation:.3f}</b><br>Points above line: Kalshi higher<br>Points below line: Polymarket higher",
-        showarrow=False,
-        font=dict(size=12, color="white"),
-        align="left",
-        bgcolor="rgba(0,0,0,0.6)",
-        bordercolor="rgba(255,255,255,0.3)",
-        borderwidth=1,
-        borderpad=10
-    )
-    
-    fig.update_layout(
-        title=dict(
-            text="<b>📊 Platform Price Correlation: Kalshi vs Polymarket</b><br><sup>2024 Presidential Election - Trump Win Probability</sup>",
-            font=dict(size=20)
-        ),
-        xaxis_title="Polymarket Price (%)",
-        yaxis_title="Kalshi Price (%)",
-        template="plotly_dark",
-        height=700,
-        showlegend=True,
-        legend=dict(
-            yanchor="bottom",
-            y=0.02,
-            xanchor="right",
-            x=0.98
-        )
-    )
-    
-    # Make axes equal
-    fig.update_xaxes(range=[min_val, max_val])
-    fig.update_yaxes(range=[min_val, max_val], scaleanchor="x", scaleratio=1)
-    
-    return fig
+    correlation = float(np.corrcoef(kalshi_prices, polymarket_prices)[0, 1])
+    
+    layout = {
+        **BASE_DARK,
+        "title": {
+            "text": "<b>📊 Platform Price Correlation: Kalshi vs Polymarket</b><br><sup>2024 Presidential Election - Trump Win Probability</sup>",
+            "font": {"size": 20}
+        },
+        # Make axes equal
+        "xaxis": {"title": {"text": "Polymarket Price (%)"}, "range": [min_val, max_val]},
+        "yaxis": {"title": {"text": "Kalshi Price (%)"}, "range": [min_val, max_val], "scaleanchor": "x", "scaleratio": 1},
+        "legend": {
+            "yanchor": "bottom",
+            "y": 0.02,
+            "xanchor": "right",
+            "x": 0.98
+        },
+        "hovermode": "closest",
+        "annotations": [{
+            "x": 0.05,
+            "y": 0.95,
+            "xref": "paper",
+            "yref": "paper",
+            "text": f"<b>Correlation: r = {correlation:.3f}</b><br>Points above line: Kalshi higher<br>Points below line: Polymarket higher",
+            "showarrow": False,
+            "font": {"size": 12, "color": "white"},
+            "align": "left",
+            "bgcolor": "rgba(0,0,0,0.6)",
+            "bordercolor": "rgba(255,255,255,0.3)",
+            "borderwidth": 1,
+            "borderpad": 10
+        }]
+    }
+    
+    return {"data": data, "layout": layout}
 
 
-def create_volume_comparison(kalshi, polymarket):
+def create_volume_comparison(common_dates, kalshi_dict, polymarket_dict):
     """Create volume comparison chart"""
-    kalshi_data = kalshi.get("presidential", {}).get("daily_data", [])
-    polymarket_data = polymarket.get("presidential_2024_trump", {}).get("daily_data", [])
-    
-    if not kalshi_data:
-        return None
-    
-    common_dates, kalshi_dict, polymarket_dict = get_matching_dates(kalshi_data, polymarket_data)
-    
     # Extract volumes
-    kalshi_volumes = [kalshi_dict[d]["daily_volume"] / 1e6 for d in common_dates]
-    polymarket_volumes = [polymarket_dict[d]["daily_volume"] / 1e6 for d in common_dates]
-    
-    fig = make_subplots(
-        rows=1, cols=1,
-        specs=[[{"secondary_y": True}]]
-    )
-    
-    # Kalshi volume bars
-    fig.add_trace(
-        go.Bar(
-            x=common_dates,
-            y=kalshi_volumes,
-            name="Kalshi Volume",
-            marker_color="rgba(124, 77, 255, 0.7)",
-            hovertemplate="Kalshi: $%{y:.1f}M<extra></extra>"
-        )
-    )
-    
-    # Polymarket volume bars
-    fig.add_trace(
-        go.Bar(
-            x=common_dates,
-            y=polymarket_volumes,
-            name="Polymarket Volume",
-            marker_color="rgba(0, 188, 212, 0.7)",
-            hovertemplate="Polymarket: $%{y:.1f}M<extra></extra>"
-        )
-    )
+    kalshi_volumes, polymarket_volumes = [], []
+    for d in common_dates:
+        kalshi_volumes.append(kalshi_dict[d]["daily_volume"] / 1e6)
+        polymarket_volumes.append(polymarket_dict[d]["daily_volume"] / 1e6)
+    
+    data = [
+        # Kalshi volume bars
+        {
+            "type": "bar",
+            "x": common_dates,
+            "y": kalshi_volumes,
+            "name": "Kalshi Volume",
+            "marker": {"color": "rgba(124, 77, 255, 0.7)"},
+            "hovertemplate": "Kalshi: $%{y:.1f}M<extra></extra>"
+        },
+        # Polymarket volume bars
+        {
+            "type": "bar",
+            "x": common_dates,
+            "y": polymarket_volumes,
+            "name": "Polymarket Volume",
+            "marker": {"color": "rgba(0, 188, 212, 0.7)"},
+            "hovertemplate": "Polymarket: $%{y:.1f}M<extra></extra>"
+        }
+    ]
     
     # Add total stats
     kalshi_total = sum(kalshi_volumes)
     poly_total = sum(polymarket_volumes)
     
-    fig.add_annotation(
-        x=0.02,
-        y=0.98,
-        xref="paper",
-        yref="paper",
-        text=f"<b>Total Volume ({len(common_dates)} days)</b><br>Kalshi: ${kalshi_total:.1f}M<br>Polymarket: ${poly_total:.1f}M<br>Ratio: {poly_total/kalshi_total:.1f}x",
-        showarrow=False,
-        font=dict(size=11, color="white"),
-        align="left",
-        bgcolor="rgba(0,0,0,0.5)",
-        bordercolor="rgba(255,255,255,0.3)",
-        borderwidth=1,
-        borderpad=8
-    )
-    
-    fig.update_layout(
-        title=dict(
-            text="<b>💰 Daily Trading Volume: Kalshi vs Polymarket</b><br><sup>2024 Presidential Election (Overlapping Period Only)</sup>",
-            font=dict(size=20)
-        ),
-        xaxis_title="Date",
-        yaxis_title="Daily Volume (Millions USD)",
-        template="plotly_dark",
-        height=500,
-        barmode="group",
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor="rgba(0,0,0,0.5)"
-        ),
-        hovermode="x unified"
-    )
-    
-    return fig
+    layout = {
+        **BASE_DARK,
+        "title": {
+            "text": "<b>💰 Daily Trading Volume: Kalshi vs Polymarket</b><br><sup>2024 Presidential Election (Overlapping Period Only)</sup>",
+            "font": {"size": 20}
+        },
+        "xaxis": {"title": {"text": "Date"}},
+        "yaxis": {"title": {"text": "Daily Volume (Millions USD)"}},
+        "height": 500,
+        "barmode": "group",
+        "annotations": [{
+            "x": 0.02,
+            "y": 0.98,
+            "xref": "paper",
+            "yref": "paper",
+            "text": f"<b>Total Volume ({len(common_dates)} days)</b><br>Kalshi: ${kalshi_total:.1f}M<br>Polymarket: ${poly_total:.1f}M<br>Ratio: {poly_total/kalshi_total:.1f}x",
+            "showarrow": False,
+            "font": {"size": 11, "color": "white"},
+            "align": "left",
+            "bgcolor": "rgba(0,0,0,0.5)",
+            "bordercolor": "rgba(255,255,255,0.3)",
+            "borderwidth": 1,
+            "borderpad": 8
+        }]
+    }
+    
+    return {"data": data, "layout": layout}
 
 
 def main():
@@ -387,32 +377,36 @@ def main():
     print("Loading data...")
     kalshi, polymarket = load_data()
     
+    kalshi_data = kalshi.get("presidential", {}).get("daily_data", [])
+    polymarket_data = polymarket.get("presidential_2024_trump", {}).get("daily_data", [])
+    
+    if not kalshi_data:
+        print("No Kalshi presidential data available")
+        return
+    
+    # Match dates once and share the result across all three charts
+    matched = get_matching_dates(kalshi_data, polymarket_data)
+    
     # Create output directory
     output_dir = Path(__file__).parent
     
     # Presidential comparison
     print("Creating presidential comparison chart...")
-    fig = create_presidential_comparison(kalshi, polymarket)
-    if fig:
-        output_path = output_dir / "comparison_5_presidential_platforms.html"
-        fig.write_html(output_path, include_plotlyjs="cdn")
-        print(f"  ✓ Saved to {output_path}")
+    output_path = output_dir / "comparison_5_presidential_platforms.html"
+    write_html(create_presidential_comparison(*matched), output_path)
+    print(f"  ✓ Saved to {output_path}")
     
     # Scatter comparison
     print("Creating scatter comparison chart...")
-    fig = create_scatter_comparison(kalshi, polymarket)
-    if fig:
-        output_path = output_dir / "comparison_6_scatter_platforms.html"
-        fig.write_html(output_path, include_plotlyjs="cdn")
-        print(f"  ✓ Saved to {output_path}")
+    output_path = output_dir / "comparison_6_scatter_platforms.html"
+    write_html(create_scatter_comparison(*matched), output_path)
+    print(f"  ✓ Saved to {output_path}")
     
     # Volume comparison
     print("Creating volume comparison chart...")
-    fig = create_volume_comparison(kalshi, polymarket)
-    if fig:
-        output_path = output_dir / "comparison_7_volume_platforms.html"
-        fig.write_html(output_path, include_plotlyjs="cdn")
-        print(f"  ✓ Saved to {output_path}")
+    output_path = output_dir / "comparison_7_volume_platforms.html"
+    write_html(create_volume_comparison(*matched), output_path)
+    print(f"  ✓ Saved to {output_path}")
     
     print("\n✓ All comparison charts generated!")
 
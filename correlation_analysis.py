@@ -13,17 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
 import numpy as np
+import pandas as pd
 
 try:
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    import pandas as pd
+    import orjson
 except ImportError:
-    import subprocess
-    subprocess.check_call(["pip3", "install", "plotly", "pandas", "numpy", "-q"])
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    import pandas as pd
+    orjson = None
+
+from chart_helpers import downsample, subplot_layout, write_html
 
 
 # =============================================================================
@@ -32,6 +29,17 @@ except ImportError:
 
 DATA_FILE = Path("/Users/wsong/workspace/prediciton-mm/.cache/daily_price_volume.json")
 OUTPUT_DIR = Path("/Users/wsong/workspace/prediciton-mm")
+# Parsed DataFrames are cached as Parquet alongside the JSON source
+CACHE_DIR = DATA_FILE.parent
+
+# Shared layout; builders copy and override it
+BASE_LIGHT = {
+    'template': 'plotly_white',
+    'height': 700,
+    'showlegend': True,
+    'legend': {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1},
+    'hovermode': 'x unified'
+}
 
 
 # =============================================================================
@@ -39,25 +47,32 @@ OUTPUT_DIR = Path("/Users/wsong/workspace/prediciton-mm")
 # =============================================================================
 
 def load_data() -> Dict:
+    if orjson is not None:
+        return orjson.loads(DATA_FILE.read_bytes())
     with open(DATA_FILE, 'r') as f:
         return json.load(f)
 
 
 def parse_market_data(market_data: Dict) -> pd.DataFrame:
     """Parse market data into DataFrame"""
-    records = []
-    for d in market_data.get('daily_data', []):
-        records.append({
-            'date': datetime.strptime(d['date'], '%Y-%m-%d'),
-            'price': d['price'],
-            'probability': d['price'] * 100,
-            'volume': d['daily_volume'],
-            'volume_millions': d['daily_volume'] / 1e6,
-            'event': d.get('event', '')
-        })
-    
-    df = pd.DataFrame(records)
-    df = df.sort_values('date')
+    daily = market_data.get('daily_data', [])
+    
+    # Build whole columns at once; dates are parsed in a single vectorized call
+    dates = pd.to_datetime([d['date'] for d in daily], format='%Y-%m-%d', cache=True)
+    prices = np.fromiter((d['price'] for d in daily), dtype=np.float64, count=len(daily))
+    volumes = np.fromiter((d['daily_volume'] for d in daily), dtype=np.float64, count=len(daily))
+    events = [d.get('event', '') for d in daily]
+    
+    df = pd.DataFrame({
+        'date': dates,
+        'price': prices,
+        'probability': prices * 100,
+        'volume': volumes,
+        'volume_millions': volumes / 1e6,
+        'event': events
+    })
+    if not dates.is_monotonic_increasing:
+        df = df.sort_values('date')
     
     # Calculate derived metrics
     df['price_change'] = df['price'].diff()
@@ -68,6 +83,37 @@ def parse_market_data(market_data: Dict) -> pd.DataFrame:
     return df
 
 
+def load_markets(market_keys: List[str]) -> Dict[str, pd.DataFrame]:
+    """Parsed DataFrame per market, reusing Parquet caches keyed by the source JSON's mtime"""
+    mtime = DATA_FILE.stat().st_mtime_ns
+    frames = {}
+    missing = []
+    for key in market_keys:
+        cache_path = CACHE_DIR / f"{mtime}_{key}.parquet"
+        if cache_path.exists():
+            frames[key] = pd.read_parquet(cache_path)
+        else:
+            missing.append(key)
+    
+    if missing:
+        data = load_data()
+        for key in missing:
+            df = parse_market_data(data[key])
+            frames[key] = df
+            try:
+                df.to_parquet(CACHE_DIR / f"{mtime}_{key}.parquet")
+            except ImportError:
+                pass  # no Parquet engine; run uncached
+        
+        # Drop caches built from older versions of the JSON, for every market
+        for cache_path in CACHE_DIR.glob("*_*.parquet"):
+            prefix = cache_path.name.split("_", 1)[0]
+            if prefix.isdigit() and prefix != str(mtime):
+                cache_path.unlink()
+    
+    return frames
+
+
 # =============================================================================
 # Chart 1: Presidential Election - Price vs Volume Dual Axis
 # =============================================================================
@@ -75,7 +121,7 @@ def parse_market_data(market_data: Dict) -> pd.DataFrame:
 def create_presidential_chart(df: pd.DataFrame, output_path: str):
     """Create dual-axis chart for presidential election"""
     
-    fig = make_subplots(
+    layout = subplot_layout(
         rows=2, cols=1,
         row_heights=[0.6, 0.4],
         shared_xaxes=True,
@@ -86,95 +132,101 @@ def create_presidential_chart(df: pd.DataFrame, output_path: str):
         )
     )
     
-    # Price line
-    fig.add_trace(
-        go.Scatter(
-            x=df['date'],
-            y=df['probability'],
-            mode='lines+markers',
-            name='Trump Win Probability',
-            line=dict(color='#E74C3C', width=3),
-            marker=dict(size=6),
-            hovertemplate="<b>%{x|%b %d, %Y}</b><br>Probability: %{y:.1f}%<extra></extra>"
-        ),
-        row=1, col=1
-    )
+    # Volume bars with color gradient based on price change
+    pc = df['price_change'].fillna(0).to_numpy()
+    colors = np.select([pc > 0, pc < 0], ['#2ECC71', '#E74C3C'], '#3498DB').tolist()
+    
+    price_x, price_y = downsample(df['date'], df['probability'])
+    
+    data = [
+        # Price line (WebGL)
+        {
+            'type': 'scattergl',
+            'x': price_x,
+            'y': price_y,
+            'mode': 'lines',
+            'name': 'Trump Win Probability',
+            'line': {'color': '#E74C3C', 'width': 3},
+            'hovertemplate': "<b>%{x|%b %d, %Y}</b><br>Probability: %{y:.1f}%<extra></extra>",
+            'xaxis': 'x',
+            'yaxis': 'y'
+        },
+        {
+            'type': 'bar',
+            'x': df['date'],
+            'y': df['volume_millions'],
+            'name': 'Daily Volume',
+            'marker': {'color': colors},
+            'opacity': 0.7,
+            'hovertemplate': "<b>%{x|%b %d, %Y}</b><br>Volume: $%{y:.1f}M<extra></extra>",
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        }
+    ]
     
     # 50% reference line
-    fig.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=1)
-    
-    # Volume bars with color gradient based on price change
-    colors = ['#2ECC71' if pc > 0 else '#E74C3C' if pc < 0 else '#3498DB' 
-              for pc in df['price_change'].fillna(0)]
-    
-    fig.add_trace(
-        go.Bar(
-            x=df['date'],
-            y=df['volume_millions'],
-            name='Daily Volume',
-            marker_color=colors,
-            opacity=0.7,
-            hovertemplate="<b>%{x|%b %d, %Y}</b><br>Volume: $%{y:.1f}M<extra></extra>"
-        ),
-        row=2, col=1
-    )
+    shapes = [{
+        'type': 'line',
+        'x0': 0, 'x1': 1, 'xref': 'x domain',
+        'y0': 50, 'y1': 50, 'yref': 'y',
+        'line': {'dash': 'dash', 'color': 'gray'},
+        'opacity': 0.5
+    }]
     
     # Add event annotations
+    annotations = layout['annotations']
     events = df[df['event'] != '']
     for _, row in events.iterrows():
-        fig.add_annotation(
-            x=row['date'],
-            y=row['probability'],
-            text=row['event'],
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowcolor='orange',
-            font=dict(size=9, color='orange'),
-            bgcolor='rgba(255,255,255,0.8)',
-            row=1, col=1
-        )
+        annotations.append({
+            'x': row['date'],
+            'y': row['probability'],
+            'xref': 'x',
+            'yref': 'y',
+            'text': row['event'],
+            'showarrow': True,
+            'arrowhead': 2,
+            'arrowsize': 1,
+            'arrowcolor': 'orange',
+            'font': {'size': 9, 'color': 'orange'},
+            'bgcolor': 'rgba(255,255,255,0.8)'
+        })
     
     # Calculate correlation
     corr = df['price'].corr(df['volume'])
     
-    fig.update_layout(
-        title={
-            'text': f"2024 US Presidential Election - Trump<br><sup>Daily Price vs Volume Analysis | Correlation: {corr:.3f}</sup>",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18}
-        },
-        template='plotly_white',
-        height=700,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
-        hovermode='x unified'
-    )
-    
-    fig.update_yaxes(title_text="Probability (%)", row=1, col=1)
-    fig.update_yaxes(title_text="Volume ($M)", row=2, col=1)
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    
     # Add summary stats
-    fig.add_annotation(
-        text=(
+    annotations.append({
+        'text': (
             f"<b>Summary Stats</b><br>"
             f"Total Volume: ${df['volume'].sum()/1e9:.2f}B<br>"
             f"Peak Volume: ${df['volume'].max()/1e6:.0f}M<br>"
             f"Price Range: {df['probability'].min():.0f}% - {df['probability'].max():.0f}%<br>"
             f"Outcome: Trump Won"
         ),
-        xref="paper", yref="paper",
-        x=0.02, y=0.98,
-        showarrow=False,
-        font=dict(size=10),
-        bgcolor='lightyellow',
-        borderpad=8,
-        align='left'
+        'xref': 'paper', 'yref': 'paper',
+        'x': 0.02, 'y': 0.98,
+        'showarrow': False,
+        'font': {'size': 10},
+        'bgcolor': 'lightyellow',
+        'borderpad': 8,
+        'align': 'left'
+    })
+    
+    layout['yaxis']['title'] = {'text': "Probability (%)"}
+    layout['yaxis2']['title'] = {'text': "Volume ($M)"}
+    layout['xaxis2']['title'] = {'text': "Date"}
+    layout.update(
+        BASE_LIGHT,
+        title={
+            'text': f"2024 US Presidential Election - Trump<br><sup>Daily Price vs Volume Analysis | Correlation: {corr:.3f}</sup>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18}
+        },
+        shapes=shapes
     )
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html({'data': data, 'layout': layout}, output_path)
     print(f"📊 Chart saved: {output_path}")
 
 
@@ -185,7 +237,7 @@ def create_presidential_chart(df: pd.DataFrame, output_path: str):
 def create_nyc_mayor_chart(df: pd.DataFrame, output_path: str):
     """Create dual-axis chart for NYC mayor election"""
     
-    fig = make_subplots(
+    layout = subplot_layout(
         rows=2, cols=1,
         row_heights=[0.6, 0.4],
         shared_xaxes=True,
@@ -196,81 +248,85 @@ def create_nyc_mayor_chart(df: pd.DataFrame, output_path: str):
         )
     )
     
-    # Price line
-    fig.add_trace(
-        go.Scatter(
-            x=df['date'],
-            y=df['probability'],
-            mode='lines+markers',
-            name='Mamdani Win Probability',
-            line=dict(color='#9B59B6', width=3),
-            marker=dict(size=6),
-            fill='tozeroy',
-            fillcolor='rgba(155, 89, 182, 0.2)',
-            hovertemplate="<b>%{x|%b %d, %Y}</b><br>Probability: %{y:.1f}%<extra></extra>"
-        ),
-        row=1, col=1
-    )
+    # Volume bars
+    pc = df['price_change'].fillna(0).to_numpy()
+    colors = np.select([pc > 0, pc < 0], ['#2ECC71', '#E74C3C'], '#3498DB').tolist()
+    
+    price_x, price_y = downsample(df['date'], df['probability'])
+    
+    data = [
+        # Price line
+        {
+            'type': 'scatter',
+            'x': price_x,
+            'y': price_y,
+            'mode': 'lines',
+            'name': 'Mamdani Win Probability',
+            'line': {'color': '#9B59B6', 'width': 3},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(155, 89, 182, 0.2)',
+            'hovertemplate': "<b>%{x|%b %d, %Y}</b><br>Probability: %{y:.1f}%<extra></extra>",
+            'xaxis': 'x',
+            'yaxis': 'y'
+        },
+        {
+            'type': 'bar',
+            'x': df['date'],
+            'y': df['volume_millions'],
+            'name': 'Daily Volume',
+            'marker': {'color': colors},
+            'opacity': 0.7,
+            'hovertemplate': "<b>%{x|%b %d, %Y}</b><br>Volume: $%{y:.1f}M<extra></extra>",
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        }
+    ]
     
     # 50% reference line
-    fig.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=1)
-    
-    # Volume bars
-    colors = ['#2ECC71' if pc > 0 else '#E74C3C' if pc < 0 else '#3498DB' 
-              for pc in df['price_change'].fillna(0)]
-    
-    fig.add_trace(
-        go.Bar(
-            x=df['date'],
-            y=df['volume_millions'],
-            name='Daily Volume',
-            marker_color=colors,
-            opacity=0.7,
-            hovertemplate="<b>%{x|%b %d, %Y}</b><br>Volume: $%{y:.1f}M<extra></extra>"
-        ),
-        row=2, col=1
-    )
+    shapes = [{
+        'type': 'line',
+        'x0': 0, 'x1': 1, 'xref': 'x domain',
+        'y0': 50, 'y1': 50, 'yref': 'y',
+        'line': {'dash': 'dash', 'color': 'gray'},
+        'opacity': 0.5
+    }]
     
     # Calculate correlation
     corr = df['price'].corr(df['volume'])
     
-    fig.update_layout(
-        title={
-            'text': f"2025 NYC Mayor Election - Mamdani<br><sup>Daily Price vs Volume Analysis | Correlation: {corr:.3f}</sup>",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18}
-        },
-        template='plotly_white',
-        height=700,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
-        hovermode='x unified'
-    )
-    
-    fig.update_yaxes(title_text="Probability (%)", row=1, col=1)
-    fig.update_yaxes(title_text="Volume ($M)", row=2, col=1)
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    
     # Add summary stats
-    fig.add_annotation(
-        text=(
+    layout['annotations'].append({
+        'text': (
             f"<b>Summary Stats</b><br>"
             f"Total Volume: ${df['volume'].sum()/1e6:.1f}M<br>"
             f"Peak Volume: ${df['volume'].max()/1e6:.0f}M<br>"
             f"Price Range: {df['probability'].min():.0f}% - {df['probability'].max():.0f}%<br>"
             f"Outcome: Mamdani Won"
         ),
-        xref="paper", yref="paper",
-        x=0.02, y=0.98,
-        showarrow=False,
-        font=dict(size=10),
-        bgcolor='lightyellow',
-        borderpad=8,
-        align='left'
+        'xref': 'paper', 'yref': 'paper',
+        'x': 0.02, 'y': 0.98,
+        'showarrow': False,
+        'font': {'size': 10},
+        'bgcolor': 'lightyellow',
+        'borderpad': 8,
+        'align': 'left'
+    })
+    
+    layout['yaxis']['title'] = {'text': "Probability (%)"}
+    layout['yaxis2']['title'] = {'text': "Volume ($M)"}
+    layout['xaxis2']['title'] = {'text': "Date"}
+    layout.update(
+        BASE_LIGHT,
+        title={
+            'text': f"2025 NYC Mayor Election - Mamdani<br><sup>Daily Price vs Volume Analysis | Correlation: {corr:.3f}</sup>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18}
+        },
+        shapes=shapes
     )
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html({'data': data, 'layout': layout}, output_path)
     print(f"📊 Chart saved: {output_path}")
 
 
@@ -278,10 +334,24 @@ def create_nyc_mayor_chart(df: pd.DataFrame, output_path: str):
 # Chart 3: Correlation Scatter Plot - Both Elections
 # =============================================================================
 
+# Marker colors are UNIX seconds, computed as one vectorized timedelta division
+# (independent of the datetime64 unit pandas picked when parsing)
+EPOCH = pd.Timestamp(0)
+ONE_SECOND = pd.Timedelta(seconds=1)
+
+
+def _linfit(x: np.ndarray, y: np.ndarray):
+    """Closed-form least-squares slope and intercept (degree-1 polyfit)"""
+    xm, ym = x.mean(), y.mean()
+    dx = x - xm
+    m = (dx * (y - ym)).sum() / (dx * dx).sum()
+    return m, ym - m * xm
+
+
 def create_correlation_scatter(df_pres: pd.DataFrame, df_nyc: pd.DataFrame, output_path: str):
     """Create scatter plot showing price-volume correlation"""
     
-    fig = make_subplots(
+    layout = subplot_layout(
         rows=1, cols=2,
         subplot_titles=(
             "2024 Presidential (Trump)",
@@ -290,122 +360,122 @@ def create_correlation_scatter(df_pres: pd.DataFrame, df_nyc: pd.DataFrame, outp
         horizontal_spacing=0.12
     )
     
-    # Presidential scatter
-    fig.add_trace(
-        go.Scatter(
-            x=df_pres['probability'],
-            y=df_pres['volume_millions'],
-            mode='markers',
-            name='Presidential',
-            marker=dict(
-                size=12,
-                color=df_pres['date'].apply(lambda x: x.timestamp()),
-                colorscale='Reds',
-                showscale=False,
-                opacity=0.7
-            ),
-            text=df_pres['date'].dt.strftime('%b %d'),
-            hovertemplate="<b>%{text}</b><br>Probability: %{x:.1f}%<br>Volume: $%{y:.1f}M<extra></extra>"
-        ),
-        row=1, col=1
-    )
-    
-    # Add trendline for presidential
-    z = np.polyfit(df_pres['probability'], df_pres['volume_millions'], 1)
-    p = np.poly1d(z)
-    x_line = np.linspace(df_pres['probability'].min(), df_pres['probability'].max(), 100)
-    fig.add_trace(
-        go.Scatter(
-            x=x_line,
-            y=p(x_line),
-            mode='lines',
-            name='Trend (Pres)',
-            line=dict(color='red', dash='dash'),
-            showlegend=False
-        ),
-        row=1, col=1
-    )
-    
-    # NYC Mayor scatter
-    fig.add_trace(
-        go.Scatter(
-            x=df_nyc['probability'],
-            y=df_nyc['volume_millions'],
-            mode='markers',
-            name='NYC Mayor',
-            marker=dict(
-                size=12,
-                color=df_nyc['date'].apply(lambda x: x.timestamp()),
-                colorscale='Purples',
-                showscale=False,
-                opacity=0.7
-            ),
-            text=df_nyc['date'].dt.strftime('%b %d'),
-            hovertemplate="<b>%{text}</b><br>Probability: %{x:.1f}%<br>Volume: $%{y:.1f}M<extra></extra>"
-        ),
-        row=1, col=2
-    )
-    
-    # Add trendline for NYC
-    z2 = np.polyfit(df_nyc['probability'], df_nyc['volume_millions'], 1)
-    p2 = np.poly1d(z2)
-    x_line2 = np.linspace(df_nyc['probability'].min(), df_nyc['probability'].max(), 100)
-    fig.add_trace(
-        go.Scatter(
-            x=x_line2,
-            y=p2(x_line2),
-            mode='lines',
-            name='Trend (NYC)',
-            line=dict(color='purple', dash='dash'),
-            showlegend=False
-        ),
-        row=1, col=2
-    )
+    # Trendlines are straight, so the two endpoints are all plotly needs
+    x_pres = df_pres['probability'].to_numpy()
+    m, b = _linfit(x_pres, df_pres['volume_millions'].to_numpy())
+    x_line = np.array([x_pres.min(), x_pres.max()])
+    
+    x_nyc = df_nyc['probability'].to_numpy()
+    m2, b2 = _linfit(x_nyc, df_nyc['volume_millions'].to_numpy())
+    x_line2 = np.array([x_nyc.min(), x_nyc.max()])
+    
+    data = [
+        # Presidential scatter
+        {
+            'type': 'scatter',
+            'x': df_pres['probability'],
+            'y': df_pres['volume_millions'],
+            'mode': 'markers',
+            'name': 'Presidential',
+            'marker': {
+                'size': 12,
+                'color': (df_pres['date'] - EPOCH) // ONE_SECOND,
+                'colorscale': 'Reds',
+                'showscale': False,
+                'opacity': 0.7
+            },
+            'text': df_pres['date'].dt.strftime('%b %d'),
+            'hovertemplate': "<b>%{text}</b><br>Probability: %{x:.1f}%<br>Volume: $%{y:.1f}M<extra></extra>",
+            'xaxis': 'x',
+            'yaxis': 'y'
+        },
+        {
+            'type': 'scatter',
+            'x': x_line,
+            'y': m * x_line + b,
+            'mode': 'lines',
+            'name': 'Trend (Pres)',
+            'line': {'color': 'red', 'dash': 'dash'},
+            'showlegend': False,
+            'xaxis': 'x',
+            'yaxis': 'y'
+        },
+        # NYC Mayor scatter
+        {
+            'type': 'scatter',
+            'x': df_nyc['probability'],
+            'y': df_nyc['volume_millions'],
+            'mode': 'markers',
+            'name': 'NYC Mayor',
+            'marker': {
+                'size': 12,
+                'color': (df_nyc['date'] - EPOCH) // ONE_SECOND,
+                'colorscale': 'Purples',
+                'showscale': False,
+                'opacity': 0.7
+            },
+            'text': df_nyc['date'].dt.strftime('%b %d'),
+            'hovertemplate': "<b>%{text}</b><br>Probability: %{x:.1f}%<br>Volume: $%{y:.1f}M<extra></extra>",
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        },
+        {
+            'type': 'scatter',
+            'x': x_line2,
+            'y': m2 * x_line2 + b2,
+            'mode': 'lines',
+            'name': 'Trend (NYC)',
+            'line': {'color': 'purple', 'dash': 'dash'},
+            'showlegend': False,
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        }
+    ]
     
     # Calculate correlations
     corr_pres = df_pres['probability'].corr(df_pres['volume_millions'])
     corr_nyc = df_nyc['probability'].corr(df_nyc['volume_millions'])
     
-    fig.update_layout(
+    # Add correlation annotations
+    layout['annotations'].extend([
+        {
+            'text': f"r = {corr_pres:.3f}",
+            'xref': 'x', 'yref': 'y',
+            'x': df_pres['probability'].max() - 5,
+            'y': df_pres['volume_millions'].max(),
+            'showarrow': False,
+            'font': {'size': 14, 'color': 'red'},
+            'bgcolor': 'white'
+        },
+        {
+            'text': f"r = {corr_nyc:.3f}",
+            'xref': 'x2', 'yref': 'y2',
+            'x': df_nyc['probability'].max() - 5,
+            'y': df_nyc['volume_millions'].max(),
+            'showarrow': False,
+            'font': {'size': 14, 'color': 'purple'},
+            'bgcolor': 'white'
+        }
+    ])
+    
+    for axis in ('xaxis', 'xaxis2'):
+        layout[axis]['title'] = {'text': "Probability (%)"}
+    for axis in ('yaxis', 'yaxis2'):
+        layout[axis]['title'] = {'text': "Daily Volume ($M)"}
+    layout.update(
+        BASE_LIGHT,
         title={
             'text': "Price vs Volume Correlation Analysis<br><sup>Higher prices often correlate with higher trading activity</sup>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 18}
         },
-        template='plotly_white',
         height=550,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+        legend={'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'center', 'x': 0.5},
+        hovermode='closest'
     )
     
-    fig.update_xaxes(title_text="Probability (%)", row=1, col=1)
-    fig.update_xaxes(title_text="Probability (%)", row=1, col=2)
-    fig.update_yaxes(title_text="Daily Volume ($M)", row=1, col=1)
-    fig.update_yaxes(title_text="Daily Volume ($M)", row=1, col=2)
-    
-    # Add correlation annotations
-    fig.add_annotation(
-        text=f"r = {corr_pres:.3f}",
-        xref="x1", yref="y1",
-        x=df_pres['probability'].max() - 5,
-        y=df_pres['volume_millions'].max(),
-        showarrow=False,
-        font=dict(size=14, color='red'),
-        bgcolor='white'
-    )
-    
-    fig.add_annotation(
-        text=f"r = {corr_nyc:.3f}",
-        xref="x2", yref="y2",
-        x=df_nyc['probability'].max() - 5,
-        y=df_nyc['volume_millions'].max(),
-        showarrow=False,
-        font=dict(size=14, color='purple'),
-        bgcolor='white'
-    )
-    
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html({'data': data, 'layout': layout}, output_path)
     print(f"📊 Chart saved: {output_path}")
 
 
@@ -416,7 +486,7 @@ def create_correlation_scatter(df_pres: pd.DataFrame, df_nyc: pd.DataFrame, outp
 def create_combined_timeline(df_pres: pd.DataFrame, df_nyc: pd.DataFrame, output_path: str):
     """Create combined timeline showing both elections normalized"""
     
-    fig = make_subplots(
+    layout = subplot_layout(
         rows=2, cols=2,
         subplot_titles=(
             "Presidential - Price Trend",
@@ -424,87 +494,98 @@ def create_combined_timeline(df_pres: pd.DataFrame, df_nyc: pd.DataFrame, output
             "Presidential - Volume Pattern",
             "NYC Mayor - Volume Pattern"
         ),
+        # Each market's price and volume panels share one date axis
+        shared_xaxes=True,
         vertical_spacing=0.15,
         horizontal_spacing=0.1
     )
     
-    # Presidential Price
-    fig.add_trace(
-        go.Scatter(
-            x=df_pres['date'],
-            y=df_pres['probability'],
-            mode='lines+markers',
-            name='Trump',
-            line=dict(color='#E74C3C', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(231, 76, 60, 0.2)'
-        ),
-        row=1, col=1
-    )
-    
-    # NYC Price
-    fig.add_trace(
-        go.Scatter(
-            x=df_nyc['date'],
-            y=df_nyc['probability'],
-            mode='lines+markers',
-            name='Mamdani',
-            line=dict(color='#9B59B6', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(155, 89, 182, 0.2)'
-        ),
-        row=1, col=2
-    )
-    
-    # Presidential Volume
-    fig.add_trace(
-        go.Bar(
-            x=df_pres['date'],
-            y=df_pres['volume_millions'],
-            name='Pres Volume',
-            marker_color='#E74C3C',
-            opacity=0.7,
-            showlegend=False
-        ),
-        row=2, col=1
-    )
-    
-    # NYC Volume
-    fig.add_trace(
-        go.Bar(
-            x=df_nyc['date'],
-            y=df_nyc['volume_millions'],
-            name='NYC Volume',
-            marker_color='#9B59B6',
-            opacity=0.7,
-            showlegend=False
-        ),
-        row=2, col=2
-    )
+    pres_x, pres_y = downsample(df_pres['date'], df_pres['probability'])
+    nyc_x, nyc_y = downsample(df_nyc['date'], df_nyc['probability'])
+    
+    data = [
+        # Presidential Price
+        {
+            'type': 'scatter',
+            'x': pres_x,
+            'y': pres_y,
+            'mode': 'lines+markers',
+            'name': 'Trump',
+            'line': {'color': '#E74C3C', 'width': 2},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(231, 76, 60, 0.2)',
+            'xaxis': 'x',
+            'yaxis': 'y'
+        },
+        # NYC Price
+        {
+            'type': 'scatter',
+            'x': nyc_x,
+            'y': nyc_y,
+            'mode': 'lines+markers',
+            'name': 'Mamdani',
+            'line': {'color': '#9B59B6', 'width': 2},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(155, 89, 182, 0.2)',
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        },
+        # Presidential Volume
+        {
+            'type': 'bar',
+            'x': df_pres['date'],
+            'y': df_pres['volume_millions'],
+            'name': 'Pres Volume',
+            'marker': {'color': '#E74C3C'},
+            'opacity': 0.7,
+            'showlegend': False,
+            'xaxis': 'x3',
+            'yaxis': 'y3'
+        },
+        # NYC Volume
+        {
+            'type': 'bar',
+            'x': df_nyc['date'],
+            'y': df_nyc['volume_millions'],
+            'name': 'NYC Volume',
+            'marker': {'color': '#9B59B6'},
+            'opacity': 0.7,
+            'showlegend': False,
+            'xaxis': 'x4',
+            'yaxis': 'y4'
+        }
+    ]
     
     # Add 50% lines
-    for col in [1, 2]:
-        fig.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=col)
-    
-    fig.update_layout(
+    shapes = [
+        {
+            'type': 'line',
+            'x0': 0, 'x1': 1, 'xref': f'{xref} domain',
+            'y0': 50, 'y1': 50, 'yref': yref,
+            'line': {'dash': 'dash', 'color': 'gray'},
+            'opacity': 0.5
+        }
+        for xref, yref in (('x', 'y'), ('x2', 'y2'))
+    ]
+    
+    layout['yaxis']['title'] = {'text': "Probability (%)"}
+    layout['yaxis2']['title'] = {'text': "Probability (%)"}
+    layout['yaxis3']['title'] = {'text': "Volume ($M)"}
+    layout['yaxis4']['title'] = {'text': "Volume ($M)"}
+    layout.update(
+        BASE_LIGHT,
         title={
             'text': "Election Market Comparison<br><sup>Price Trends and Volume Patterns</sup>",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 18}
         },
-        template='plotly_white',
-        height=700,
-        showlegend=True,
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+        legend={'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'center', 'x': 0.5},
+        hovermode='closest',
+        shapes=shapes
     )
     
-    fig.update_yaxes(title_text="Probability (%)", row=1, col=1)
-    fig.update_yaxes(title_text="Probability (%)", row=1, col=2)
-    fig.update_yaxes(title_text="Volume ($M)", row=2, col=1)
-    fig.update_yaxes(title_text="Volume ($M)", row=2, col=2)
-    
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html({'data': data, 'layout': layout}, output_path)
     print(f"📊 Chart saved: {output_path}")
 
 
@@ -520,10 +601,9 @@ def main():
     
     # Load data
     print("\n📊 Loading data...")
-    data = load_data()
-    
-    df_pres = parse_market_data(data['presidential_2024_trump'])
-    df_nyc = parse_market_data(data['nyc_mayor_2025_mamdani'])
+    markets = load_markets(['presidential_2024_trump', 'nyc_mayor_2025_mamdani'])
+    df_pres = markets['presidential_2024_trump']
+    df_nyc = markets['nyc_mayor_2025_mamdani']
     
     print(f"   Presidential: {len(df_pres)} data points")
     print(f"   NYC Mayor: {len(df_nyc)} data points")
@@ -6,21 +6,23 @@ Fetches real on-chain volume data for Super Bowl 2025
 
 import os
 import json
+import hashlib
+import time
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from dotenv import load_dotenv
 
-# Load environment variables from .env
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson
 except ImportError:
-    print("Installing python-dotenv...")
-    import subprocess
-    subprocess.run(["pip3", "install", "python-dotenv"], capture_output=True)
-    from dotenv import load_dotenv
-    load_dotenv()
+    orjson = None
+
+# Load environment variables from .env
+load_dotenv()
 
 DUNE_API_KEY = os.getenv("DUNE_API_KEY")
 if not DUNE_API_KEY:
@@ -31,9 +33,31 @@ if not DUNE_API_KEY:
 BASE_URL = "https://api.dune.com/api/v1"
 HEADERS = {"X-Dune-API-Key": DUNE_API_KEY}
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Result polling: back off 2s -> 4s -> 8s between checks, give up after 2 minutes
+POLL_INITIAL_DELAY = 2
+POLL_MAX_DELAY = 8
+POLL_TIMEOUT = 120
+
+# Completed query results are cached per SQL text; reruns within the TTL skip Dune entirely
+CACHE_DIR = Path(__file__).parent / ".cache"
+QUERY_CACHE_DIR = CACHE_DIR / "dune_queries"
+QUERY_CACHE_TTL = 24 * 60 * 60
+
 
 def execute_sql_query(sql: str):
-    """Execute a raw SQL query on Dune"""
+    """Execute a raw SQL query on Dune, reusing a recent cached result for the same SQL"""
+    cache_file = QUERY_CACHE_DIR / f"{hashlib.sha256(sql.encode()).hexdigest()}.json"
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < QUERY_CACHE_TTL:
+        print(f"Using cached results from {cache_file}")
+        if orjson is not None:
+            return orjson.loads(cache_file.read_bytes())
+        with open(cache_file, "r") as f:
+            return json.load(f)
+    
     url = f"{BASE_URL}/query/execute"
     
     payload = {
@@ -41,7 +65,7 @@ def execute_sql_query(sql: str):
         "is_private": False
     }
     
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code != 200:
         print(f"Execute failed: {response.status_code}")
@@ -53,22 +77,48 @@ def execute_sql_query(sql: str):
     print(f"Query executing... ID: {execution_id}")
     
     # Poll for results
-    import time
-    
-    for i in range(60):  # Max 60 attempts (2 minutes)
-        time.sleep(2)
+    delay = POLL_INITIAL_DELAY
+    waited = 0
+    while waited < POLL_TIMEOUT:
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, POLL_MAX_DELAY)
         status_url = f"{BASE_URL}/execution/{execution_id}/status"
-        status_resp = requests.get(status_url, headers=HEADERS)
+        status_resp = SESSION.get(status_url)
         status = status_resp.json()
         state = status.get("state")
         
-        if i % 5 == 0:
-            print(f"  Status: {state} ({i*2}s)")
+        print(f"  Status: {state} ({waited}s)")
         
         if state == "QUERY_STATE_COMPLETED":
             results_url = f"{BASE_URL}/execution/{execution_id}/results"
-            results_resp = requests.get(results_url, headers=HEADERS)
-            return results_resp.json()
+            results_resp = SESSION.get(results_url)
+            
+            if not results_resp.ok:
+                print(f"Results fetch failed: {results_resp.status_code}")
+                print(results_resp.text)
+                return None
+            
+            if orjson is not None:
+                results = orjson.loads(results_resp.content)
+            else:
+                results = results_resp.json()
+            if "result" not in results:
+                # Error bodies must not be cached for QUERY_CACHE_TTL
+                print(f"Results missing 'result': {results}")
+                return None
+            
+            QUERY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Expired results for other SQL would never be read again
+            for old_file in QUERY_CACHE_DIR.glob("*.json"):
+                if time.time() - old_file.stat().st_mtime >= QUERY_CACHE_TTL:
+                    old_file.unlink()
+            if orjson is not None:
+                cache_file.write_bytes(orjson.dumps(results))
+            else:
+                with open(cache_file, "w") as f:
+                    json.dump(results, f)
+            return results
         elif state in ["QUERY_STATE_FAILED", "QUERY_STATE_CANCELLED"]:
             print(f"Query failed: {status}")
             return None
@@ -87,19 +137,13 @@ def fetch_polymarket_daily_volume():
     sql = """
     SELECT 
         date_trunc('day', block_time) as date,
-        SUM(
-            CASE 
-                WHEN tx_to = 0x4bfb41d5b3570defd03c39a9a4d8de6bd8b8982e THEN value / 1e6
-                WHEN tx_to = 0xC5d563A36AE78145C45a50134d48A1215220f80a THEN value / 1e6
-                ELSE 0
-            END
-        ) as volume_usd
+        SUM(CAST(value AS DOUBLE)) / 1e6 as volume_usd
     FROM polygon.transactions
     WHERE block_time >= date '2024-09-01'
         AND block_time < date '2025-03-01'
-        AND (
-            tx_to = 0x4bfb41d5b3570defd03c39a9a4d8de6bd8b8982e  -- CTF Exchange
-            OR tx_to = 0xC5d563A36AE78145C45a50134d48A1215220f80a  -- NegRisk Exchange
+        AND tx_to IN (
+            0x4bfb41d5b3570defd03c39a9a4d8de6bd8b8982e,  -- CTF Exchange
+            0xC5d563A36AE78145C45a50134d48A1215220f80a   -- NegRisk Exchange
         )
         AND success = true
     GROUP BY 1
@@ -113,12 +157,23 @@ def fetch_polymarket_daily_volume():
         print(f"\n✓ Successfully fetched {len(rows)} days of data!")
         
         # Save to cache
-        cache_dir = Path(__file__).parent / ".cache"
-        cache_dir.mkdir(exist_ok=True)
+        CACHE_DIR.mkdir(exist_ok=True)
+        
+        # Typed columnar cache; read back with pd.read_parquet
+        df = pd.DataFrame(rows, columns=["date", "volume_usd"])
+        df["date"] = pd.to_datetime(df["date"])
+        df["volume_usd"] = df["volume_usd"].astype("float64")
         
-        output_path = cache_dir / "dune_polymarket_volume.json"
-        with open(output_path, "w") as f:
-            json.dump(rows, f, indent=2)
+        output_path = CACHE_DIR / "dune_polymarket_volume.parquet"
+        try:
+            df.to_parquet(output_path, compression="zstd", index=False)
+        except ImportError:
+            output_path = CACHE_DIR / "dune_polymarket_volume.json"
+            if orjson is not None:
+                output_path.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w") as f:
+                    json.dump(rows, f, indent=2)
         print(f"✓ Data saved to {output_path}")
         
         # Print sample
@@ -5,41 +5,66 @@ Using real trade data from Kaggle Polymarket Dataset
 """
 
 import json
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from pathlib import Path
 
+from chart_helpers import downsample, write_html
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DATA_FILE = Path('.cache/f1_norris_daily.json')
+
+# Column arrays built from DATA_FILE, keyed by its mtime
+_daily_arrays = {}
+
 def load_data():
     """Load F1 daily data from cache"""
-    with open('.cache/f1_norris_daily.json', 'r') as f:
+    if orjson is not None:
+        return orjson.loads(DATA_FILE.read_bytes())
+    with open(DATA_FILE, 'r') as f:
         return json.load(f)
 
+def load_daily_arrays():
+    """Return (dates, prices %, volumes $, trades) for the daily data in one pass"""
+    mtime = DATA_FILE.stat().st_mtime_ns
+    if mtime not in _daily_arrays:
+        daily = load_data()['daily_data']
+        dates, avg_prices, daily_volumes, daily_trades = zip(*(
+            (d['date'], d['avg_price'], d['daily_volume'], d['trades']) for d in daily
+        )) if daily else ((), (), (), ())
+        _daily_arrays.clear()
+        _daily_arrays[mtime] = (
+            list(dates),
+            np.fromiter(avg_prices, dtype=np.float64, count=len(daily)) * 100,  # Convert to percentage
+            np.fromiter(daily_volumes, dtype=np.float64, count=len(daily)),
+            np.fromiter(daily_trades, dtype=np.int64, count=len(daily))
+        )
+    return _daily_arrays[mtime]
+
 def calculate_correlation(prices, volumes):
     """Calculate Pearson correlation coefficient"""
-    n = len(prices)
-    if n < 2:
+    a = np.asarray(prices, dtype=np.float64)
+    b = np.asarray(volumes, dtype=np.float64)
+    if len(a) < 2:
         return 0
     
-    mean_p = sum(prices) / n
-    mean_v = sum(volumes) / n
+    a_m = a - a.mean()
+    b_m = b - b.mean()
+    ss = (a_m @ a_m) * (b_m @ b_m)
     
-    cov = sum((p - mean_p) * (v - mean_v) for p, v in zip(prices, volumes)) / n
-    std_p = (sum((p - mean_p)**2 for p in prices) / n) ** 0.5
-    std_v = (sum((v - mean_v)**2 for v in volumes) / n) ** 0.5
-    
-    if std_p > 0 and std_v > 0:
-        return cov / (std_p * std_v)
+    if ss > 0:
+        return float(a_m @ b_m / np.sqrt(ss))
     return 0
 
 def create_correlation_chart():
     """Create price-volume correlation chart for F1 2025"""
-    data = load_data()
-    daily = data['daily_data']
-    
-    dates = [d['date'] for d in daily]
-    prices = [d['avg_price'] * 100 for d in daily]  # Convert to percentage
-    volumes = [d['daily_volume'] / 1e3 for d in daily]  # Convert to thousands
-    trades = [d['trades'] for d in daily]
+    dates, prices, daily_volumes, trades = load_daily_arrays()
+    volumes = daily_volumes / 1e3  # Convert to thousands
     
     # Calculate correlation
     correlation = calculate_correlation(prices, volumes)
@@ -65,11 +90,12 @@ def create_correlation_chart():
         secondary_y=False
     )
     
-    # Price line
+    # Price line, thinned with MinMaxLTTB when long; bars and stats keep full data
+    price_x, price_y = downsample(dates, prices)
     fig.add_trace(
         go.Scatter(
-            x=dates,
-            y=prices,
+            x=price_x,
+            y=price_y,
             mode="lines+markers",
             name="Win Probability (%)",
             line=dict(color="#FF6B00", width=3),  # McLaren orange
@@ -80,8 +106,8 @@ def create_correlation_chart():
     )
     
     # Stats annotation
-    total_vol = sum(d['daily_volume'] for d in daily)
-    total_trades = sum(d['trades'] for d in daily)
+    total_vol = daily_volumes.sum()
+    total_trades = trades.sum()
     
     stats_text = f"""<b>Price-Volume Correlation</b>
 r = {correlation:.3f}
@@ -89,7 +115,7 @@ r = {correlation:.3f}
 <b>Market Stats:</b>
 Total Volume: ${total_vol/1e6:.2f}M
 Total Trades: {total_trades:,}
-Days: {len(daily)}
+Days: {len(dates)}
 
 <b>Data Source:</b>
 Kaggle Polymarket Dataset
@@ -137,19 +163,14 @@ Kaggle Polymarket Dataset
 
 def create_scatter_chart():
     """Create scatter plot for price vs volume"""
-    data = load_data()
-    daily = data['daily_data']
-    
-    prices = [d['avg_price'] * 100 for d in daily]
-    volumes = [d['daily_volume'] for d in daily]
-    dates = [d['date'] for d in daily]
+    dates, prices, volumes, _ = load_daily_arrays()
     
     correlation = calculate_correlation(prices, volumes)
     
     fig = go.Figure()
     
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=prices,
             y=volumes,
             mode="markers+text",
@@ -189,7 +210,7 @@ def main():
     print("Creating price-volume timeline...")
     fig, corr = create_correlation_chart()
     output_path = output_dir / "correlation_6_f1_norris.html"
-    fig.write_html(output_path, include_plotlyjs="cdn")
+    write_html(fig.to_plotly_json(), output_path)
     print(f"  ✓ Saved to {output_path}")
     print(f"  Correlation: r = {corr:.3f}")
     
@@ -197,7 +218,7 @@ def main():
     print("Creating scatter plot...")
     fig = create_scatter_chart()
     output_path = output_dir / "correlation_7_f1_scatter.html"
-    fig.write_html(output_path, include_plotlyjs="cdn")
+    write_html(fig.to_plotly_json(), output_path)
     print(f"  ✓ Saved to {output_path}")
     
     print("\n✓ F1 correlation charts generated with REAL trade data!")
@@ -5,13 +5,30 @@ Fetches historical candlestick data from Kalshi API for comparison with Polymark
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Kalshi API base URL
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+# Candlestick fields kept by process_candlesticks (missing ones default to 0)
+CANDLE_COLUMNS = [
+    "end_period_ts", "price.open", "price.high", "price.low", "price.close",
+    "volume", "open_interest"
+]
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # Market tickers
 MARKETS = {
     "presidential": {
@@ -40,51 +57,36 @@ def fetch_candlesticks(series_ticker: str, market_ticker: str, start_ts: int, en
         "period_interval": 1440  # Daily
     }
     
-    response = requests.get(url, params=params)
+    response = SESSION.get(url, params=params)
     
     if response.status_code != 200:
         print(f"Error fetching {market_ticker}: {response.status_code}")
         print(response.text)
         return []
     
-    data = response.json()
+    data = orjson.loads(response.content) if orjson is not None else response.json()
     return data.get("candlesticks", [])
 
 
-def process_candlesticks(candlesticks: list) -> list:
-    """Process raw candlestick data into daily price/volume records"""
-    daily_data = []
+def process_candlesticks(candlesticks: list) -> pd.DataFrame:
+    """Process raw candlestick data into a date-sorted daily price/volume frame"""
+    # Flatten the nested price dict into price.open/high/low/close columns
+    candles = pd.json_normalize(candlesticks).reindex(columns=CANDLE_COLUMNS).fillna(0)
     
-    for candle in candlesticks:
-        # Extract timestamp and convert to date
-        end_ts = candle.get("end_period_ts", 0)
-        date = datetime.utcfromtimestamp(end_ts).strftime("%Y-%m-%d")
-        
-        # Extract price data (closing price in cents, convert to 0-1 scale)
-        price_data = candle.get("price", {})
-        close_price = price_data.get("close", 0) / 100.0
-        high_price = price_data.get("high", 0) / 100.0
-        low_price = price_data.get("low", 0) / 100.0
-        open_price = price_data.get("open", 0) / 100.0
-        
-        # Extract volume
-        volume = candle.get("volume", 0)
-        open_interest = candle.get("open_interest", 0)
-        
-        daily_data.append({
-            "date": date,
-            "price": close_price,
-            "high": high_price,
-            "low": low_price,
-            "open": open_price,
-            "daily_volume": volume,
-            "open_interest": open_interest
-        })
+    daily = pd.DataFrame({
+        # Candle end timestamp -> UTC date
+        "date": pd.to_datetime(candles["end_period_ts"], unit="s", utc=True).dt.strftime("%Y-%m-%d"),
+        # Prices are in cents; convert to 0-1 scale
+        "price": candles["price.close"] / 100.0,
+        "high": candles["price.high"] / 100.0,
+        "low": candles["price.low"] / 100.0,
+        "open": candles["price.open"] / 100.0,
+        "daily_volume": candles["volume"].astype("int64"),
+        "open_interest": candles["open_interest"].astype("int64")
+    })
     
     # Sort by date
-    daily_data.sort(key=lambda x: x["date"])
-    
-    return daily_data
+    return daily.sort_values("date", kind="stable")
 
 
 def main():
@@ -95,21 +97,29 @@ def main():
         "note": "Kalshi launched 2024 presidential markets in Oct 2024, so data coverage is shorter than Polymarket"
     }
     
+    # Markets are independent, so their requests run concurrently on the shared session
+    with ThreadPoolExecutor(max_workers=len(MARKETS)) as executor:
+        futures = {}
+        for market_key, market_info in MARKETS.items():
+            print(f"Fetching {market_info['title']}...")
+            futures[market_key] = executor.submit(
+                fetch_candlesticks,
+                market_info["series_ticker"],
+                market_info["market_ticker"],
+                market_info["start_ts"],
+                market_info["end_ts"]
+            )
+    
     for market_key, market_info in MARKETS.items():
-        print(f"Fetching {market_info['title']}...")
-        
-        candlesticks = fetch_candlesticks(
-            market_info["series_ticker"],
-            market_info["market_ticker"],
-            market_info["start_ts"],
-            market_info["end_ts"]
-        )
+        candlesticks = futures[market_key].result()
         
+        print(f"{market_info['title']}:")
         if candlesticks:
-            daily_data = process_candlesticks(candlesticks)
+            daily = process_candlesticks(candlesticks)
+            daily_data = daily.to_dict("records")
             
             # Calculate total volume
-            total_volume = sum(d["daily_volume"] for d in daily_data)
+            total_volume = int(daily["daily_volume"].sum())
             
             output[market_key] = {
                 "title": market_info["title"],
@@ -131,8 +141,11 @@ def main():
     cache_dir.mkdir(exist_ok=True)
     output_path = cache_dir / "kalshi_data.json"
     
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(output, f, indent=2)
     
     print(f"\n✓ Data saved to {output_path}")
     return output
@@ -10,21 +10,22 @@ Creates 4 separate interactive HTML charts:
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
+import numpy as np
+import pandas as pd
+from plotly.colors import qualitative
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from chart_helpers import write_html
+
 try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
+    import orjson
 except ImportError:
-    import subprocess
-    subprocess.check_call(["pip3", "install", "plotly", "pandas", "-q"])
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-
-import pandas as pd
+    orjson = None
 
 
 # =============================================================================
@@ -34,63 +35,86 @@ import pandas as pd
 DATA_FILE = Path("/Users/wsong/workspace/prediciton-mm/.cache/nyc_mayor_markets.json")
 OUTPUT_DIR = Path("/Users/wsong/workspace/prediciton-mm")
 
+# Raw Gamma API market fields used by parse_markets
+MARKET_FIELDS = [
+    'id', 'groupItemTitle', 'question', 'volume', 'volume1wk', 'volume1mo',
+    'outcomePrices', 'clobTokenIds', 'startDate', 'endDate', 'closed'
+]
+
 
 # =============================================================================
 # Data Loading
 # =============================================================================
 
+@lru_cache(maxsize=4)
 def load_market_data() -> Dict:
-    """Load market data from cache"""
-    with open(DATA_FILE, 'r') as f:
-        data = json.load(f)
+    """Load market data from cache (parsed once per process)"""
+    if orjson is not None:
+        data = orjson.loads(DATA_FILE.read_bytes())
+    else:
+        with open(DATA_FILE, 'r') as f:
+            data = json.load(f)
     return data[0] if data else {}
 
 
+def _decode_json_column(raw: pd.Series) -> pd.Series:
+    """Decode a column of JSON-encoded lists with one parser call; already-decoded values pass through"""
+    encoded = [v for v in raw if isinstance(v, str)]
+    batch = '[' + ','.join(encoded) + ']'
+    decoded = iter(orjson.loads(batch) if orjson is not None else json.loads(batch))
+    return pd.Series(
+        [next(decoded) if isinstance(v, str) else v for v in raw],
+        index=raw.index, dtype=object
+    )
+
+
 def parse_markets(event_data: Dict) -> pd.DataFrame:
     """Parse market data into DataFrame"""
-    markets = event_data.get('markets', [])
+    # Every field we read is present as a column (NaN where a market lacks it)
+    markets = pd.DataFrame(event_data.get('markets', [])).reindex(columns=MARKET_FIELDS)
+    
+    names = markets['groupItemTitle'].fillna(markets['question'].fillna('Unknown').str[:30])
+    
+    # Skip placeholder markets
+    keep = ~(names.str.startswith('Person ') | (names == 'Other'))
+    markets, names = markets[keep], names[keep]
+    
+    volume = pd.to_numeric(markets['volume'], errors='coerce').fillna(0)
+    
+    prices = _decode_json_column(markets['outcomePrices'].fillna('[0, 0]'))
+    yes_price = pd.to_numeric(prices.str[0], errors='coerce').fillna(0).astype(float)
+    
+    clob_ids = _decode_json_column(markets['clobTokenIds'].fillna('[]'))
+    
+    df = pd.DataFrame({
+        'candidate': names,
+        'market_id': markets['id'].fillna(''),
+        'volume': volume,
+        'volume_millions': volume / 1e6,
+        'volume_1wk': pd.to_numeric(markets['volume1wk'], errors='coerce').fillna(0),
+        'volume_1mo': pd.to_numeric(markets['volume1mo'], errors='coerce').fillna(0),
+        'price': yes_price,
+        'probability_pct': yes_price * 100,
+        'token_id': clob_ids.str[0].fillna('').astype(str),
+        'start_date': markets['startDate'].fillna(''),
+        'end_date': markets['endDate'].fillna(''),
+        'closed': markets['closed'].fillna(False).astype(bool),
+        'winner': yes_price >= 0.99
+    }).reset_index(drop=True)
     
-    records = []
-    for m in markets:
-        name = m.get('groupItemTitle', m.get('question', 'Unknown')[:30])
-        
-        # Skip placeholder markets
-        if name.startswith('Person ') or name == 'Other':
-            continue
-        
-        volume = float(m.get('volume', 0) or 0)
-        volume_1wk = float(m.get('volume1wk', 0) or 0)
-        volume_1mo = float(m.get('volume1mo', 0) or 0)
-        
-        prices_raw = m.get('outcomePrices', '[0, 0]')
-        prices = json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
-        yes_price = float(prices[0]) if prices else 0
-        
-        clob_ids_raw = m.get('clobTokenIds', '[]')
-        clob_ids = json.loads(clob_ids_raw) if isinstance(clob_ids_raw, str) else clob_ids_raw
-        
-        start_date = m.get('startDate', '')
-        end_date = m.get('endDate', '')
-        closed = m.get('closed', False)
-        
-        records.append({
-            'candidate': name,
-            'market_id': m.get('id', ''),
-            'volume': volume,
-            'volume_millions': volume / 1e6,
-            'volume_1wk': volume_1wk,
-            'volume_1mo': volume_1mo,
-            'price': yes_price,
-            'probability_pct': yes_price * 100,
-            'token_id': clob_ids[0] if clob_ids else '',
-            'start_date': start_date,
-            'end_date': end_date,
-            'closed': closed,
-            'winner': yes_price >= 0.99
-        })
-    
-    df = pd.DataFrame(records)
     df = df.sort_values('volume', ascending=False)
+    
+    # Compact dtypes: float32 prices and categorical identifiers. downcast='float' is lossy
+    # within float32 tolerance, so the volume columns shown in $M totals stay float64
+    for col in ('price', 'probability_pct'):
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in ('candidate', 'market_id', 'token_id'):
+        df[col] = df[col].astype('category')
+    
+    # Marker colors and the winning row, shared by every chart
+    df['color_winner'] = np.where(df['winner'], '#2ECC71', '#3498DB')
+    df['color_loser'] = np.where(df['winner'], '#2ECC71', '#E74C3C')
+    df.attrs['winner'] = df.loc[df['winner']].iloc[0].to_dict() if df['winner'].any() else None
     return df
 
 
@@ -101,15 +125,12 @@ def parse_markets(event_data: Dict) -> pd.DataFrame:
 def create_volume_chart(df: pd.DataFrame, output_path: str):
     """Create interactive bar chart comparing candidate volumes"""
     
-    # Color based on winner
-    colors = ['#2ECC71' if w else '#3498DB' for w in df['winner']]
-    
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
         x=df['candidate'],
         y=df['volume_millions'],
-        marker_color=colors,
+        marker_color=df['color_winner'].values,
         text=[f"${v:.2f}M" for v in df['volume_millions']],
         textposition='outside',
         hovertemplate=(
@@ -118,7 +139,7 @@ def create_volume_chart(df: pd.DataFrame, output_path: str):
             "Probability: %{customdata[0]:.1f}%<br>" +
             "<extra></extra>"
         ),
-        customdata=df[['probability_pct']].values
+        customdata=df['probability_pct'].to_numpy(dtype=np.float32).reshape(-1, 1)
     ))
     
     fig.update_layout(
@@ -137,10 +158,10 @@ def create_volume_chart(df: pd.DataFrame, output_path: str):
     )
     
     # Add annotation for winner
-    winner = df[df['winner'] == True]['candidate'].values
-    if len(winner) > 0:
+    winner = df.attrs['winner']
+    if winner is not None:
         fig.add_annotation(
-            text=f"🏆 Winner: {winner[0]}",
+            text=f"🏆 Winner: {winner['candidate']}",
             xref="paper", yref="paper",
             x=0.98, y=0.98,
             showarrow=False,
@@ -159,7 +180,7 @@ def create_volume_chart(df: pd.DataFrame, output_path: str):
         font=dict(size=12)
     )
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html(fig.to_plotly_json(), output_path)
     print(f"📊 Chart 1 saved: {output_path}")
 
 
@@ -185,7 +206,7 @@ def create_market_share_chart(df: pd.DataFrame, output_path: str):
         df_filtered = pd.concat([df_filtered, other_row], ignore_index=True)
     
     # Custom colors
-    colors = px.colors.qualitative.Set2[:len(df_filtered)]
+    colors = qualitative.Set2[:len(df_filtered)]
     
     fig = go.Figure()
     
@@ -229,7 +250,7 @@ def create_market_share_chart(df: pd.DataFrame, output_path: str):
         )]
     )
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html(fig.to_plotly_json(), output_path)
     print(f"📊 Chart 2 saved: {output_path}")
 
 
@@ -255,7 +276,7 @@ def create_candidate_comparison_chart(df: pd.DataFrame, output_path: str):
             x=df_top['candidate'],
             y=df_top['volume_millions'],
             name='Total Volume',
-            marker_color=['#2ECC71' if w else '#3498DB' for w in df_top['winner']],
+            marker_color=df_top['color_winner'].values,
             text=[f"${v:.1f}M" for v in df_top['volume_millions']],
             textposition='outside',
         ),
@@ -309,7 +330,7 @@ def create_candidate_comparison_chart(df: pd.DataFrame, output_path: str):
     fig.update_yaxes(title_text="Volume (Millions USD)", row=1, col=1)
     fig.update_yaxes(title_text="Volume (Millions USD)", row=2, col=1)
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html(fig.to_plotly_json(), output_path)
     print(f"📊 Chart 3 saved: {output_path}")
 
 
@@ -325,13 +346,11 @@ def create_results_chart(df: pd.DataFrame, output_path: str):
     fig = go.Figure()
     
     # Horizontal bar for final probability
-    colors = ['#2ECC71' if w else '#E74C3C' for w in df_sorted['winner']]
-    
     fig.add_trace(go.Bar(
         y=df_sorted['candidate'],
         x=df_sorted['probability_pct'],
         orientation='h',
-        marker_color=colors,
+        marker_color=df_sorted['color_loser'].values,
         text=[f"{p:.0f}%" for p in df_sorted['probability_pct']],
         textposition='inside',
         textfont=dict(color='white', size=12),
@@ -341,7 +360,7 @@ def create_results_chart(df: pd.DataFrame, output_path: str):
             "Volume: $%{customdata[0]:.2f}M<br>" +
             "<extra></extra>"
         ),
-        customdata=df_sorted[['volume_millions']].values
+        customdata=df_sorted['volume_millions'].to_numpy(dtype=np.float32).reshape(-1, 1)
     ))
     
     fig.update_layout(
@@ -362,10 +381,10 @@ def create_results_chart(df: pd.DataFrame, output_path: str):
     fig.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
     
     # Winner annotation
-    winner = df[df['winner'] == True]
-    if not winner.empty:
-        winner_name = winner['candidate'].values[0]
-        winner_vol = winner['volume_millions'].values[0]
+    winner = df.attrs['winner']
+    if winner is not None:
+        winner_name = winner['candidate']
+        winner_vol = winner['volume_millions']
         
         fig.add_annotation(
             text=f"🏆 WINNER: {winner_name}<br>Volume: ${winner_vol:.2f}M",
@@ -398,7 +417,7 @@ def create_results_chart(df: pd.DataFrame, output_path: str):
         align='left'
     )
     
-    fig.write_html(output_path, include_plotlyjs='cdn')
+    write_html(fig.to_plotly_json(), output_path)
     print(f"📊 Chart 4 saved: {output_path}")
 
 
@@ -421,7 +440,8 @@ def main():
     print(f"\n   Event: {event_data.get('title', 'NYC Mayor Election')}")
     print(f"   Candidates: {len(df)}")
     print(f"   Total Volume: ${df['volume_millions'].sum():.2f}M")
-    print(f"   Winner: {df[df['winner'] == True]['candidate'].values}")
+    winner = df.attrs['winner']
+    print(f"   Winner: {winner['candidate'] if winner else 'N/A'}")
     
     # Create charts
     print("\n📈 Generating interactive charts...")
@@ -457,9 +477,11 @@ def main():
     print("\n📋 Data Summary:\n")
     print(f"{'Candidate':<20} {'Volume':>12} {'Probability':>12} {'Winner':>8}")
     print("-" * 55)
-    for _, row in df.iterrows():
-        winner_icon = "🏆" if row['winner'] else ""
-        print(f"{row['candidate']:<20} ${row['volume_millions']:>9.2f}M {row['probability_pct']:>10.1f}% {winner_icon:>8}")
+    rows = df[['candidate', 'volume_millions', 'probability_pct', 'winner']].itertuples(index=False, name=None)
+    print("\n".join(
+        f"{candidate:<20} ${volume:>9.2f}M {prob:>10.1f}% {'🏆' if winner else '':>8}"
+        for candidate, volume, prob, winner in rows
+    ))
 
 
 if __name__ == "__main__":
@@ -13,23 +13,26 @@ Charts:
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
 
 try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.ticker import FuncFormatter
+    import orjson
 except ImportError:
-    import subprocess
-    subprocess.check_call(["pip3", "install", "matplotlib", "-q"])
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.ticker import FuncFormatter
+    orjson = None
+
+# matplotlib is imported on first use by _ensure_mpl so the data helpers stay light
+plt = None
+mdates = None
+FuncFormatter = None
+
+# (fig, axes) reused by create_dashboard; built on first render
+_FIG_CACHE = None
 
 
 # =============================================================================
@@ -40,25 +43,32 @@ CACHE_DIR = Path("/Users/wsong/workspace/prediciton-mm/.cache")
 DATA_FILE = CACHE_DIR / "election_prices_verified.json"
 OUTPUT_DIR = Path("/Users/wsong/workspace/prediciton-mm")
 
+# Event annotation styles, shared by every annotate call
+_BBOX = dict(boxstyle='round,pad=0.2', facecolor='yellow', alpha=0.7)
+_ARROW = dict(arrowstyle='->', connectionstyle='arc3,rad=0')
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
-class PricePoint:
-    timestamp: datetime
-    price: float
-    event: str = ""
+def _empty_array(dtype):
+    """Dataclass field defaulting to a fresh empty array (markets without price history)"""
+    return field(default_factory=lambda: np.empty(0, dtype=dtype))
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     name: str
     platform: str
     question: str
     outcome: str
-    prices: List[PricePoint]
+    # Price history as aligned columns, sorted by timestamp
+    timestamps: np.ndarray = _empty_array('datetime64[s]')
+    prices: np.ndarray = _empty_array(np.float64)
+    events: np.ndarray = _empty_array(object)
+    # Matplotlib date numbers (days since the 1970 epoch) for timestamps
+    x_num: np.ndarray = _empty_array(np.float64)
     total_volume: float = 0.0
     status: str = "RESOLVED"
 
@@ -72,31 +82,74 @@ def load_data() -> Dict:
     if not DATA_FILE.exists():
         raise FileNotFoundError(f"Data file not found: {DATA_FILE}")
     
-    with open(DATA_FILE, 'r') as f:
+    return _load_data_cached(str(DATA_FILE), DATA_FILE.stat().st_mtime)
+
+
+@lru_cache(maxsize=4)
+def _load_data_cached(path: str, mtime: float) -> Dict:
+    """Parse the data file once per (path, mtime); edits to the file miss the cache"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
         return json.load(f)
 
 
-def parse_prices(price_data: List[Dict]) -> List[PricePoint]:
-    """Parse price data into PricePoint objects"""
-    prices = []
-    for p in price_data:
-        date_str = p.get("date", "")
-        try:
-            if "T" in date_str:
-                # Has time component: YYYY-MM-DDTHH:MM
-                ts = datetime.strptime(date_str, "%Y-%m-%dT%H:%M")
-            else:
-                ts = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            prices.append(PricePoint(
-                timestamp=ts,
-                price=float(p.get("price", 0.5)),
-                event=p.get("event", "")
-            ))
-        except Exception as e:
-            print(f"Error parsing date {date_str}: {e}")
+_price_fields = itemgetter("date", "price", "event")
+
+
+def _get_price_fields(p: Dict) -> Tuple:
+    """(date, price, event) of one price point, defaulting any missing key"""
+    try:
+        return _price_fields(p)
+    except KeyError:
+        return p.get("date", ""), p.get("price", 0.5), p.get("event", "")
+
+
+def parse_prices(price_data: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse price data into aligned (timestamps, prices, events) arrays sorted by time"""
+    date_strs, raw_prices, raw_events = zip(*map(_get_price_fields, price_data)) if price_data else ((), (), ())
+    
+    # Dates are YYYY-MM-DDTHH:MM or YYYY-MM-DD; anything else becomes NaT and is skipped
+    dates = pd.Series(date_strs, dtype=object)
+    has_time = dates.str.contains("T", regex=False).fillna(False).astype(bool)
+    with_time = pd.to_datetime(dates.where(has_time), format="%Y-%m-%dT%H:%M", errors="coerce")
+    date_only = pd.to_datetime(dates.where(~has_time), format="%Y-%m-%d", errors="coerce")
+    timestamps = pd.DatetimeIndex(with_time.where(has_time, date_only))
+    
+    # Null or non-numeric prices become NaN and, like bad dates, drop the row
+    try:
+        prices = np.array(raw_prices, dtype=np.float64)
+    except (TypeError, ValueError):
+        prices = pd.to_numeric(np.array(raw_prices, dtype=object), errors="coerce").astype(np.float64)
+    
+    bad_date = timestamps.isna()
+    bad_price = np.isnan(prices)
+    for i in np.flatnonzero(bad_date):
+        print(f"Error parsing date {date_strs[i]!r}")
+    for i in np.flatnonzero(bad_price & ~bad_date):
+        print(f"Error parsing price {raw_prices[i]!r} on {date_strs[i]}")
+    valid = ~(bad_date | bad_price)
     
-    return sorted(prices, key=lambda x: x.timestamp)
+    idx = np.flatnonzero(valid)
+    timestamps = timestamps[idx]
+    # Cached histories are written in date order; only sort the ones that are not
+    if not timestamps.is_monotonic_increasing:
+        order = np.argsort(timestamps, kind="stable")
+        idx, timestamps = idx[order], timestamps[order]
+    events = np.array(raw_events, dtype=object)[idx]
+    return timestamps.to_numpy().astype('datetime64[s]'), prices[idx], events
+
+
+def _ensure_mpl():
+    """Import matplotlib (Agg backend) on first use"""
+    global plt, mdates, FuncFormatter
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from matplotlib.ticker import FuncFormatter
 
 
 def get_markets() -> List[Optional[MarketData]]:
@@ -107,13 +160,15 @@ def get_markets() -> List[Optional[MarketData]]:
     # 1. Polymarket 2024 Presidential
     pres_pm = data.get("2024_presidential_trump", {})
     if pres_pm and pres_pm.get("daily_prices"):
-        prices = parse_prices(pres_pm["daily_prices"])
+        timestamps, prices, events = parse_prices(pres_pm["daily_prices"])
         markets.append(MarketData(
             name="2024 Presidential Election",
             platform="Polymarket",
             question=pres_pm.get("market", "Trump 2024"),
             outcome=pres_pm.get("outcome", "Yes"),
+            timestamps=timestamps,
             prices=prices,
+            events=events,
             total_volume=pres_pm.get("total_volume", 0)
         ))
     else:
@@ -122,13 +177,15 @@ def get_markets() -> List[Optional[MarketData]]:
     # 2. Kalshi 2024 Presidential
     pres_kal = data.get("2024_presidential_kalshi", {})
     if pres_kal and pres_kal.get("daily_prices"):
-        prices = parse_prices(pres_kal["daily_prices"])
+        timestamps, prices, events = parse_prices(pres_kal["daily_prices"])
         markets.append(MarketData(
             name="2024 Presidential Election",
             platform="Kalshi",
             question=pres_kal.get("market", "Republican 2024"),
             outcome=pres_kal.get("outcome", "Yes"),
+            timestamps=timestamps,
             prices=prices,
+            events=events,
             total_volume=pres_kal.get("total_volume", 0)
         ))
     else:
@@ -142,7 +199,6 @@ def get_markets() -> List[Optional[MarketData]]:
             platform="Polymarket",
             question="Market Not Available",
             outcome="N/A",
-            prices=[],
             status="NOT_FOUND"
         ))
     else:
@@ -156,12 +212,15 @@ def get_markets() -> List[Optional[MarketData]]:
             platform="Kalshi",
             question=nyc_kal.get("market", "NYC Mayor 2025"),
             outcome="TBD",
-            prices=[],
             status=nyc_kal.get("status", "ACTIVE")
         ))
     else:
         markets.append(None)
     
+    for market in markets:
+        if market:
+            market.x_num = market.timestamps.astype("datetime64[s]").astype(float) / 86400
+    
     return markets
 
 
@@ -183,11 +242,12 @@ def format_volume(volume: float) -> str:
         return "N/A"
 
 
-def create_chart(ax: plt.Axes, market: MarketData, color: str):
+def create_chart(ax: "plt.Axes", market: MarketData, color: str):
     """Create a price chart for a market"""
+    _ensure_mpl()
     ax.set_facecolor('#f8f9fa')
     
-    if not market.prices or market.status == "NOT_FOUND":
+    if len(market.prices) == 0 or market.status == "NOT_FOUND":
         # No data available
         ax.text(0.5, 0.5, 
                 f"Market Not Available\n\n{market.question}\n\nNote: {market.platform} does not have\nthis market or no historical data",
@@ -201,32 +261,32 @@ def create_chart(ax: plt.Axes, market: MarketData, color: str):
         ax.set_yticks([])
         return
     
-    dates = [p.timestamp for p in market.prices]
-    prices = [p.price for p in market.prices]
+    x = market.x_num
+    prices = market.prices
     
-    # Plot area fill
-    ax.fill_between(dates, prices, alpha=0.3, color=color)
+    # Plot area fill (rasterized when saved to PDF/SVG; the line stays vector)
+    ax.fill_between(x, prices, alpha=0.3, color=color, rasterized=True)
     
     # Plot line
-    ax.plot(dates, prices, color=color, linewidth=2, marker='o', markersize=3)
+    ax.plot(x, prices, color=color, linewidth=2, marker='o', markersize=3)
     
     # Add 50% reference line
     ax.axhline(y=0.5, color='gray', linestyle='--', alpha=0.5, linewidth=1)
     
     # Add event annotations
-    events = [(p.timestamp, p.price, p.event) for p in market.prices if p.event]
-    for ts, price, event in events[:5]:  # Limit to 5 events
-        ax.annotate(event, xy=(ts, price), xytext=(0, 10),
+    event_idx = np.flatnonzero(market.events.astype(bool))[:5]  # Non-empty events, limit 5
+    for xv, price, event in zip(x[event_idx], prices[event_idx], market.events[event_idx]):
+        ax.annotate(event, xy=(xv, price), xytext=(0, 10),
                    textcoords='offset points', fontsize=7, ha='center',
-                   bbox=dict(boxstyle='round,pad=0.2', facecolor='yellow', alpha=0.7),
-                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+                   bbox=_BBOX, arrowprops=_ARROW)
     
     # Configure axes
     ax.set_ylim(0, 1.05)
     ax.set_ylabel('Probability', fontsize=10)
     ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f'{y*100:.0f}%'))
     
-    # X axis formatting
+    # X axis formatting (data is plotted as date numbers)
+    ax.xaxis_date()
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=8)
@@ -246,9 +306,28 @@ def create_chart(ax: plt.Axes, market: MarketData, color: str):
             ha='center', va='bottom', style='italic', color='gray')
 
 
+def _get_fig():
+    """The 2x2 dashboard figure and axes, created once and reused across renders"""
+    global _FIG_CACHE
+    if _FIG_CACHE is None:
+        _FIG_CACHE = plt.subplots(2, 2, figsize=(16, 12))
+    return _FIG_CACHE
+
+
 def create_dashboard(markets: List[Optional[MarketData]], save_path: str):
     """Create a 2x2 dashboard with all markets"""
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    _ensure_mpl()
+    fig, axes = _get_fig()
+    
+    # Reset whatever a previous render left on the reused figure
+    for ax in axes.flat:
+        ax.cla()
+        ax.set_facecolor(plt.rcParams['axes.facecolor'])  # cla keeps the old facecolor
+    for text in list(fig.texts):
+        text.remove()
+    # tight_layout starts from the current spacing, so restore the defaults first
+    fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                           for k in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
     fig.patch.set_facecolor('white')
     
     fig.suptitle('Election Market Dashboard\nPolymarket & Kalshi Historical Prices (Price = Probability)', 
@@ -284,9 +363,8 @@ def create_dashboard(markets: List[Optional[MarketData]], save_path: str):
              "Note: NYC Mayor markets have limited availability on prediction platforms",
              ha='center', fontsize=9, style='italic', color='gray')
     
-    plt.tight_layout(rect=[0, 0.02, 1, 0.95])
-    plt.savefig(save_path, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout(rect=[0, 0.02, 1, 0.95])
+    fig.savefig(save_path, dpi=150, bbox_inches='tight', facecolor='white')
     print(f"\n📊 Dashboard saved to: {save_path}")
 
 
@@ -311,7 +389,7 @@ def main():
         print("\n" + "-" * 40)
         for i, m in enumerate(markets):
             if m:
-                status = "✅" if m.prices else "⚠️ (no price data)"
+                status = "✅" if len(m.prices) else "⚠️ (no price data)"
                 print(f"   {status} {m.name} ({m.platform}): {len(m.prices)} points")
             else:
                 print(f"   ❌ Market {i+1}: Not loaded")
@@ -5,11 +5,14 @@ Compiled from public news reports and market data observations
 """
 
 import json
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from pathlib import Path
 from datetime import datetime
 
+from chart_helpers import write_html
+
 # Super Bowl LIX Data - Eagles vs Chiefs (Feb 9, 2025)
 # Compiled from web searches and news reports
 SUPERBOWL_DATA = {
@@ -327,13 +330,9 @@ def create_price_volume_correlation_chart():
     )
     
     # Calculate correlation
-    n = len(prices)
-    mean_p = sum(prices) / n
-    mean_v = sum(volumes) / n
-    cov = sum((p - mean_p) * (v - mean_v) for p, v in zip(prices, volumes)) / n
-    std_p = (sum((p - mean_p)**2 for p in prices) / n) ** 0.5
-    std_v = (sum((v - mean_v)**2 for v in volumes) / n) ** 0.5
-    correlation = cov / (std_p * std_v) if std_p > 0 and std_v > 0 else 0
+    p = np.asarray(prices, dtype=np.float64)
+    v = np.asarray(volumes, dtype=np.float64)
+    correlation = float(np.corrcoef(p, v)[0, 1]) if p.std() > 0 and v.std() > 0 else 0
     
     # Add key event annotations
     events = [
@@ -419,21 +418,21 @@ def main():
     print("Creating timeline comparison chart...")
     fig = create_superbowl_comparison_chart()
     output_path = output_dir / "comparison_8_superbowl_2025.html"
-    fig.write_html(output_path, include_plotlyjs="cdn")
+    write_html(fig.to_plotly_json(), output_path)
     print(f"  ✓ Saved to {output_path}")
     
     # Matchup chart
     print("Creating matchup comparison chart...")
     fig = create_superbowl_matchup_chart()
     output_path = output_dir / "comparison_9_superbowl_matchup.html"
-    fig.write_html(output_path, include_plotlyjs="cdn")
+    write_html(fig.to_plotly_json(), output_path)
     print(f"  ✓ Saved to {output_path}")
     
     # Price-Volume Correlation chart
     print("Creating price-volume correlation chart...")
     fig = create_price_volume_correlation_chart()
     output_path = output_dir / "correlation_5_superbowl.html"
-    fig.write_html(output_path, include_plotlyjs="cdn")
+    write_html(fig.to_plotly_json(), output_path)
     print(f"  ✓ Saved to {output_path}")
     
     print("\n✓ All Super Bowl comparison charts generated!")
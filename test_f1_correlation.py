@@ -0,0 +1,16 @@
+import json
+
+import f1_correlation
+
+
+def test_empty_daily_data_gives_zero_correlation(tmp_path, monkeypatch):
+    data_file = tmp_path / 'f1_norris_daily.json'
+    data_file.write_text(json.dumps({'daily_data': []}))
+    monkeypatch.setattr(f1_correlation, 'DATA_FILE', data_file)
+    monkeypatch.setattr(f1_correlation, '_daily_arrays', {})
+
+    dates, prices, volumes, trades = f1_correlation.load_daily_arrays()
+
+    assert dates == []
+    assert len(prices) == len(volumes) == len(trades) == 0
+    assert f1_correlation.calculate_correlation(prices, volumes) == 0
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+import polymarket_dashboard
+
+
+def test_parse_prices_skips_tz_aware_and_garbage_dates():
+    timestamps, prices, events = polymarket_dashboard.parse_prices([
+        {'date': '2024-01-02T12:00', 'price': 0.2, 'event': 'noon'},
+        {'date': '2024-01-01T12:00:00Z', 'price': 0.1},
+        {'date': '2024-01-01', 'price': 0.3},
+        {'date': '2024-01-03T01:00+05:00', 'price': 0.4},
+        {'date': '2024-01-01 12:00', 'price': 0.5},
+        {'date': 'garbage', 'price': 0.6},
+    ])
+
+    assert timestamps.tolist() == [datetime(2024, 1, 1), datetime(2024, 1, 2, 12)]
+    assert prices.tolist() == [0.3, 0.2]
+    assert events.tolist() == ['', 'noon']